@@ -6,24 +6,41 @@ used throughout the application.
 """
 
 import os
-from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
 
 # =============================================================================
 # API Configuration
 # =============================================================================
-FRED_API_KEY = os.getenv("FRED_API_KEY")
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load environment variables from the .env file (once per process)."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def get_fred_api_key() -> Optional[str]:
+    """Return the FRED API key from the environment / .env file (memoized)."""
+    _load_env()
+    return os.getenv("FRED_API_KEY")
+
+
+@lru_cache(maxsize=None)
+def has_fred() -> bool:
+    """True when a real FRED key is configured (placeholder from .env template excluded)."""
+    return get_fred_api_key() not in (None, "", "your_api_key_here")
 
 # =============================================================================
 # File Paths
 # =============================================================================
-PROJECT_ROOT = Path(__file__).parent
-DATA_DIR = PROJECT_ROOT / "data"
-SA_FISCAL_JSON_PATH = DATA_DIR / "sa_fiscal.json"
-DB_PATH = PROJECT_ROOT / "sentinel.db"
+# Resolved once to plain strings (no per-use PurePath arithmetic / fspath calls)
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(PROJECT_ROOT, "data")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+DB_PATH = os.path.join(PROJECT_ROOT, "sentinel.db")
 
 # =============================================================================
 # Country Configurations
@@ -66,6 +83,7 @@ COUNTRIES = {
         "source_type": "MANUAL_JSON",
         "currency_symbol": "R",
         "flag": "🇿🇦",
+        "json_path": "sa_fiscal.json",  # Relative to DATA_DIR
         "json_keys": {
             "total_debt": "debt_zar_billions",
             "interest_payments": "annual_interest_expense_zar_billions",
@@ -145,6 +163,74 @@ COUNTRIES = {
     }
 }
 
+
+def _intern_strings(node):
+    """Recursively intern str keys/values so lookups hit the identity fast path."""
+    if isinstance(node, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k): _intern_strings(v)
+            for k, v in node.items()
+        }
+    if isinstance(node, str):
+        return sys.intern(node)
+    return node
+
+
+COUNTRIES = _intern_strings(COUNTRIES)
+
+# Flat (country_code, key) -> series id / ticker / JSON key index across the
+# "metrics", "yield_curve" and "json_keys" sections, built once at import.
+METRIC_INDEX = MappingProxyType({
+    (code, key): value
+    for code, country in COUNTRIES.items()
+    for section in ("metrics", "yield_curve", "json_keys")
+    for key, value in country.get(section, {}).items()
+})
+
+# =============================================================================
+# Typed Country Views (attribute access for hot-path reads)
+# =============================================================================
+class Thresholds(NamedTuple):
+    debt_gdp_warning: float
+    debt_gdp_critical: float
+    interest_rev_warning: float
+    interest_rev_critical: float
+    yield_10y_vigilante: Optional[float] = None
+    currency_risk_critical: Optional[float] = None
+
+
+class CountryConfig(NamedTuple):
+    code: str
+    name: str
+    source_type: str
+    currency_symbol: str
+    flag: str
+    metrics: Mapping[str, str]
+    yield_curve: Mapping[str, str]
+    json_keys: Mapping[str, str]
+    thresholds: Thresholds
+
+
+COUNTRY_CONFIGS = MappingProxyType({
+    code: CountryConfig(
+        code=code,
+        name=country["name"],
+        source_type=country["source_type"],
+        currency_symbol=country.get("currency_symbol", ""),
+        flag=country.get("flag", ""),
+        metrics=MappingProxyType(country.get("metrics", {})),
+        yield_curve=MappingProxyType(country.get("yield_curve", {})),
+        json_keys=MappingProxyType(country.get("json_keys", {})),
+        thresholds=Thresholds(**country["thresholds"])
+    )
+    for code, country in COUNTRIES.items()
+})
+
+# Hot-path threshold constants (bind with `from config import ...`)
+YIELD_10Y_VIGILANTE: float = COUNTRY_CONFIGS["US"].thresholds.yield_10y_vigilante
+CURRENCY_RISK_CRITICAL: float = COUNTRY_CONFIGS["SA"].thresholds.currency_risk_critical
+
+
 # =============================================================================
 # Global Series (Net Liquidity & Macros)
 # =============================================================================
@@ -156,31 +242,18 @@ GLOBAL_SERIES = {
 }
 
 # RSS Feeds for News Ticker
-RSS_FEEDS = [
+RSS_FEEDS: Tuple[str, ...] = (
     "https://search.cnbc.com/rs/search/combinedcms/view.xml?partnerId=wrss01&id=10000664", # CNBC Finance
     "https://finance.yahoo.com/news/rssindex", # Yahoo Finance
     "http://feeds.marketwatch.com/marketwatch/topstories/" # MarketWatch
-]
-
-# Legacy mapping for data_loader compatibility
-FRED_SERIES = {
-    "fed_assets": "WALCL",
-    "tga": "WTREGEN",
-    "reverse_repo": "RRPONTSYD",
-    "cpi": "CPIAUCSL"
-}
-YFINANCE_TICKERS = {
-    "us_10y_yield": "^TNX",
-    "us_3m_yield": "^IRX",
-    "sp500": "^GSPC",
-    "usd_zar": "ZAR=X"
-}
+)
 
 # =============================================================================
 # Dashboard Settings
 # =============================================================================
 REFRESH_INTERVAL_SECONDS = 60  # How often to refresh data
 CHART_HISTORY_MONTHS = 6       # Months of history for sparkline charts
+SPARKLINE_BRAILLE = True       # Draw sparklines directly as braille (False = plotext)
 
 # =============================================================================
 # Cache Settings
@@ -6,11 +6,13 @@ Entry point for the dashboard application.
 """
 
 import sys
-from modules import data_loader
 
 def main():
     """Main entry point."""
     try:
+        # Heavy imports (pandas, DuckDB, Textual, Rich) are deferred to here
+        from modules import data_loader
+        
         # Initialize database
         data_loader.init_db()
         
@@ -5,10 +5,17 @@ This package contains all the core modules for the Sentinel dashboard:
 - data_loader: Fetches data from FRED, YFinance, and local JSON
 - logic: Financial calculations and threshold checks
 - render_chart: Plotext chart generation
+
+Submodules are imported lazily on first access so that importing one of
+them (e.g. `from modules import data_loader`) does not pull in the others.
 """
 
-from . import data_loader
-from . import logic
-from . import render_chart
+import importlib
+
 __all__ = ["data_loader", "logic", "render_chart"]
 
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
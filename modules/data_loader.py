@@ -7,47 +7,135 @@ Handles all data ingestion:
 - JSON: South African fiscal data (manual updates)
 """
 
-import json
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Optional, Any, Dict, List
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Sequence, Tuple
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-import pandas as pd
-import yfinance as yf
-from fredapi import Fred
+# pandas / yfinance take a second or more to import, so they are imported
+# where first used (on a worker thread) instead of at module load
+if TYPE_CHECKING:
+    import pandas as pd
+    import yfinance as yf
 
 import config
 from modules.db_manager import db
 
 
+@dataclass(slots=True)
+class CountryMetrics:
+    """Standard per-country metrics returned by get_country_metrics()."""
+    total_debt: Optional[float] = None
+    interest_payments: Optional[float] = None
+    tax_receipts: Optional[float] = None
+    gdp: Optional[float] = None
+    gdp_growth: Optional[float] = None
+    cpi: Optional[float] = None
+    yield_10y: Optional[float] = None
+    yield_10y_static: Optional[float] = None
+    inflation_yoy: Optional[float] = None
+    breakeven_5y: Optional[float] = None
+    term_premium_10y: Optional[float] = None
+    usd_zar: Optional[float] = None
+    gold: Optional[float] = None
+    currency_symbol: str = ""
+    last_updated: str = ""
+    errors: List[str] = field(default_factory=list)
+
+
+# Max concurrent network fetches per country refresh
+_FETCH_WORKERS = 8
+
+# Observation window for the CPI YoY read: ~2 years, leaving slack over the
+# 13 monthly points the calculation needs for missing values and late releases.
+_FRED_RECENT_WINDOW_DAYS = 730
+_YOY_TAIL_POINTS = 24  # Trailing rows scanned for the 13 valid YoY points
+
+# FRED REST endpoint, read over one keep-alive session sized for the fetch pool.
+# Rate limits (120 req/min) and transient 5xx are retried with exponential
+# backoff (0.5s, 1s, 2s; Retry-After is honoured) before falling back to stale data.
+_FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+_FRED_LATEST_LIMIT = 10  # Newest rows to scan past trailing missing values
+_FRED_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+)
+_FRED_SESSION = requests.Session()
+_FRED_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=_FETCH_WORKERS, max_retries=_FRED_RETRY)
+)
+
+# Cached chart bars older than this are refetched in full rather than topped up
+_HISTORY_INCREMENTAL_MAX_GAP_DAYS = 7
+
+# Reused yf.Ticker objects (each keeps its own HTTP session / cookies)
+_TICKERS: Dict[str, yf.Ticker] = {}
+
+# In-process metric cache: key -> (value, monotonic expiry). The DuckDB
+# metric_cache is the cold-start / persistence tier behind it.
+_MEM_CACHE: Dict[str, Tuple[float, float]] = {}
+
+# In-flight loads shared by concurrent callers: key -> Future (see _single_flight)
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Last Net Liquidity query result: {"key": input file mtimes, "data": DataFrame}
+_NET_LIQUIDITY_RESULT: Dict[str, Any] = {}
+# Last fiscal history query result, keyed the same way
+_FISCAL_HISTORY_RESULT: Dict[str, Any] = {}
+
+# Parsed manual JSON files: path -> (st_mtime_ns, data)
+_JSON_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Marks "no pre-fetched cache row supplied" (None means "looked up, not cached")
+_UNSET = object()
+
+
 def init_db() -> None:
     """Initialize the database."""
     db.init_db()
 
 
-def get_fred_client() -> Optional[Fred]:
+@lru_cache(maxsize=1)
+def fred_enabled() -> bool:
     """
-    Initialize FRED API client.
+    Check whether FRED requests can be made (warns once if not).
     
     Returns:
-        Fred client instance or None if API key not configured
+        True if a FRED API key is configured
     """
-    if not config.FRED_API_KEY or config.FRED_API_KEY == "your_api_key_here":
+    if not config.has_fred():
         print("Warning: FRED_API_KEY not configured. Set it in .env file.")
-        return None
-    return Fred(api_key=config.FRED_API_KEY)
+        return False
+    return True
 
 
-def is_fresh(timestamp_str: str, max_age_seconds: int) -> bool:
-    """Check if a cache entry is fresh."""
-    if not timestamp_str:
-        return False
-    try:
-        ts = datetime.fromisoformat(timestamp_str)
-        age = (datetime.now() - ts).total_seconds()
-        return age < max_age_seconds
-    except (ValueError, TypeError):
-        return False
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a cached yf.Ticker for `symbol`, creating it on first use."""
+    ticker = _TICKERS.get(symbol)
+    if ticker is None:
+        import yfinance as yf
+        ticker = _TICKERS.setdefault(symbol, yf.Ticker(symbol))
+    return ticker
+
+
+def is_fresh(timestamp: Optional[float], max_age_seconds: int) -> bool:
+    """Check if a cache entry (epoch-seconds timestamp from db) is fresh."""
+    return bool(timestamp) and (time.time() - timestamp) < max_age_seconds
 
 
 def get_cached_or_fetch(
@@ -55,7 +143,9 @@ def get_cached_or_fetch(
     fetch_func: callable, 
     expiry_seconds: int, 
     source_name: str,
-    errors_list: list
+    errors_list: list,
+    cached: Any = _UNSET,
+    pending_writes: Optional[list] = None
 ) -> Optional[float]:
     """
     Generic helper to get data from cache or fetch it.
@@ -66,21 +156,37 @@ def get_cached_or_fetch(
         expiry_seconds: Cache validity duration
         source_name: Name of source for error logging
         errors_list: List to append errors to
+        cached: Pre-fetched cache row (or None) from db.get_metrics_bulk;
+            when omitted the row is looked up with db.get_metric
+        pending_writes: If given, fetched (key, value, source) rows are appended
+            here for one db.set_metrics_bulk call instead of written immediately
         
     Returns:
         The metric value (float) or None
     """
-    cached = db.get_metric(key)
+    # Fast path: value fetched (or loaded) by this process and not yet expired
+    hit = _MEM_CACHE.get(key)
+    if hit is not None and time.monotonic() < hit[1]:
+        return hit[0]
+        
+    if cached is _UNSET:
+        cached = db.get_metric(key)
     
-    # If fresh, return it
+    # If fresh, remember it for the rest of its lifetime and return it
     if cached and is_fresh(cached['timestamp'], expiry_seconds):
+        age = time.time() - cached['timestamp']
+        _MEM_CACHE[key] = (cached['value'], time.monotonic() + expiry_seconds - age)
         return cached['value']
         
     # Not fresh or missing, try to fetch
     try:
         val = fetch_func()
         if val is not None:
-            db.set_metric(key, val, source_name)
+            if pending_writes is None:
+                db.set_metric(key, val, source_name)
+            else:
+                pending_writes.append((key, val, source_name))
+            _MEM_CACHE[key] = (val, time.monotonic() + expiry_seconds)
             return val
     except Exception as e:
         errors_list.append(f"{source_name} fetch error: {str(e)}")
@@ -93,7 +199,7 @@ def get_cached_or_fetch(
     return None
 
 
-def get_country_metrics(country_code: str) -> dict:
+def get_country_metrics(country_code: str) -> CountryMetrics:
     """
     Fetch standard metrics for a specific country.
     
@@ -101,159 +207,358 @@ def get_country_metrics(country_code: str) -> dict:
         country_code: 'US', 'SA', 'JP', 'UK', 'DE' (must exist in config.COUNTRIES)
         
     Returns:
-        Dictionary containing standard metrics:
-        - total_debt
-        - interest_payments
-        - tax_receipts
-        - gdp
-        - gdp_growth
-        - yield_10y
-        - inflation_yoy
-        - last_updated
-        - errors
+        CountryMetrics with every metric the country's sources provide
+        (missing values stay None) plus last_updated and errors.
     """
+    # Dashboards and the global grid refresh together: concurrent requests
+    # for the same country share one fetch
+    return _single_flight(f"metrics:{country_code}", partial(_load_country_metrics, country_code))
+
+
+def _load_country_metrics(country_code: str) -> CountryMetrics:
+    """Fetch body of get_country_metrics (runs once per in-flight country)."""
     if country_code not in config.COUNTRIES:
-        return {"errors": [f"Unknown country code: {country_code}"]}
+        return CountryMetrics(errors=[f"Unknown country code: {country_code}"])
         
-    country_config = config.COUNTRIES[country_code]
-    source_type = country_config.get("source_type")
-    
-    # Initialize result with standard keys
-    result = {
-        "total_debt": None,
-        "interest_payments": None,
-        "tax_receipts": None,
-        "gdp": None,
-        "gdp_growth": None,
-        "yield_10y": None,
-        "inflation_yoy": None,
-        "currency_symbol": country_config.get("currency_symbol", ""),
-        "last_updated": datetime.now().isoformat(),
-        "errors": []
-    }
+    result = CountryMetrics(
+        currency_symbol=config.COUNTRIES[country_code].get("currency_symbol", ""),
+        last_updated=datetime.now().isoformat()
+    )
+    fetchers = _COUNTRY_FETCHERS[country_code]
     
-    if source_type == "FRED_API":
-        _fetch_fred_metrics(country_config, result)
-    elif source_type == "MANUAL_JSON":
-        _fetch_json_metrics(country_config, result)
-        
-    # Always try to fetch live market data (Yields/FX) if configured
-    _fetch_live_market_data(country_config, result)
+    # The sources fill disjoint result keys and are network-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        for future in [executor.submit(f, country_code, result) for f in fetchers]:
+            future.result()
     
     return result
 
 
-def _fetch_fred_metrics(country_config: dict, result: dict):
-    """Fetch metrics from FRED API."""
-    fred = get_fred_client()
-    metrics_map = country_config.get("metrics", {})
-    
-    def fetch_fred_series(series_id):
-        if not fred:
-            raise Exception("FRED API key missing")
-        series = fred.get_series(series_id)
-        if series is not None and len(series) > 0:
-            latest = series.dropna().iloc[-1]
-            val = float(latest)
-            if series_id == "GFDEBTN": # Normalize to Billions
-                val = val / 1000.0
-            return val
+def get_countries_metrics(country_codes: Sequence[str]) -> Dict[str, CountryMetrics]:
+    """
+    Fetch metrics for several countries at once.
+    
+    Each country's network calls overlap with the others', so the total
+    latency is roughly the slowest country rather than the sum of all.
+    
+    Returns:
+        Dict mapping country code to CountryMetrics, in the order requested
+    """
+    if not country_codes:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(country_codes)) as executor:
+        futures = {code: executor.submit(get_country_metrics, code) for code in country_codes}
+        return {code: future.result() for code, future in futures.items()}
+
+
+def _is_market_ticker(series_id: str) -> bool:
+    """YFinance tickers contain ^ or = (e.g. ^TNX, ZAR=X); FRED IDs are alphanumeric."""
+    return str(series_id).startswith("^") or "=" in str(series_id)
+
+
+def _fetch_fred_value(series_id: str) -> Optional[float]:
+    """Latest FRED observation, normalized where the series needs it."""
+    if not fred_enabled():
+        raise Exception("FRED API key missing")
+    val = fetch_fred_latest(series_id)
+    if val is not None and series_id == "GFDEBTN": # Normalize to Billions
+        val = val / 1000.0
+    return val
+
+
+def _fetch_fred_yoy(series_id: str) -> Optional[float]:
+    """Year-over-year % change of a monthly FRED series (e.g. CPI)."""
+    if not fred_enabled(): return None
+    # YoY only needs the recent tail, not decades of history
+    series = fetch_fred_history(series_id, datetime.now() - timedelta(days=_FRED_RECENT_WINDOW_DAYS))
+    if series is None:
         return None
+    # Only the last 13 valid points matter; count after dropping gaps
+    tail = series.iloc[-_YOY_TAIL_POINTS:].dropna()
+    if len(tail) >= 13:
+        current = tail.iat[-1]
+        year_ago = tail.iat[-13]
+        return ((current - year_ago) / year_ago) * 100
+    return None
 
-    def fetch_inflation_yoy(series_id):
-        if not fred: return None
-        series = fred.get_series(series_id)
-        if series is not None and len(series) >= 13:
-            series = series.dropna()
-            current = series.iloc[-1]
-            year_ago = series.iloc[-13]
-            return ((current - year_ago) / year_ago) * 100
-        return None
 
+def _build_fred_jobs(metrics_map: Dict[str, str]) -> Tuple[Tuple[str, str, callable, str], ...]:
+    """Pre-bake (result_attr, cache_key, fetch_func, source_name) for each FRED metric."""
+    jobs = []
     for key, series_id in metrics_map.items():
-        # Skip market data tickers if they look like YFinance tickers
-        if str(series_id).startswith("^") or "=" in str(series_id):
+        # Skip market data tickers
+        if _is_market_ticker(series_id):
             continue
-        
-        # Special handling for inflation
         if key == "inflation_yoy":
-             val = get_cached_or_fetch(
-                key=f"{series_id}_yoy", # Unique cache key
-                fetch_func=lambda s=series_id: fetch_inflation_yoy(s),
+            # Unique cache key for the derived YoY value
+            jobs.append((key, f"{series_id}_yoy", partial(_fetch_fred_yoy, series_id), f"FRED ({series_id}) YoY"))
+        else:
+            jobs.append((key, series_id, partial(_fetch_fred_value, series_id), f"FRED ({series_id})"))
+    return tuple(jobs)
+
+
+def _build_market_tickers(metrics_map: Dict[str, str]) -> Dict[str, str]:
+    """Result attr -> YFinance ticker for the live market metrics a country configures."""
+    return {
+        key: metrics_map[key] for key in ("yield_10y", "usd_zar", "gold")
+        if metrics_map.get(key) and _is_market_ticker(metrics_map[key])
+    }
+
+
+# Per-country fetch plans, specialized once at import instead of re-derived
+# (key filtering, cache keys, source names, closures) on every refresh
+_FRED_JOBS = {
+    code: _build_fred_jobs(country.get("metrics", {}))
+    for code, country in config.COUNTRIES.items()
+    if country.get("source_type") == "FRED_API"
+}
+_MARKET_TICKERS = {
+    code: _build_market_tickers(country.get("metrics", {}))
+    for code, country in config.COUNTRIES.items()
+}
+
+
+def _fetch_fred_metrics(country_code: str, result: CountryMetrics):
+    """Fetch metrics from FRED API."""
+    jobs = _FRED_JOBS.get(country_code, ())
+    
+    # Series still fresh in _MEM_CACHE take get_cached_or_fetch's fast path;
+    # read the rest in one batched query (none at all when everything is warm)
+    now = time.monotonic()
+    cold_keys = {
+        cache_key for _, cache_key, _, _ in jobs
+        if cache_key not in _MEM_CACHE or now >= _MEM_CACHE[cache_key][1]
+    }
+    cached_rows = db.get_metrics_bulk(list(cold_keys)) if cold_keys else {}
+    pending_writes = []
+    
+    # Each series is an independent HTTPS round-trip: run them concurrently
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        futures = {
+            attr: executor.submit(
+                get_cached_or_fetch,
+                key=cache_key,
+                fetch_func=fetch_func,
                 expiry_seconds=config.CACHE_EXPIRY_MACRO,
-                source_name=f"FRED ({series_id}) YoY",
-                errors_list=result["errors"]
+                source_name=source_name,
+                errors_list=result.errors,
+                # A warm key that expires meanwhile falls back to db.get_metric
+                cached=cached_rows.get(cache_key) if cache_key in cold_keys else _UNSET,
+                pending_writes=pending_writes
             )
-             result[key] = val
-             continue
+            for attr, cache_key, fetch_func, source_name in jobs
+        }
+        for attr, future in futures.items():
+            setattr(result, attr, future.result())
+    
+    # Persist everything fetched in a single transaction
+    db.set_metrics_bulk(pending_writes)
 
-        val = get_cached_or_fetch(
-            key=series_id,
-            fetch_func=lambda s=series_id: fetch_fred_series(s),
-            expiry_seconds=config.CACHE_EXPIRY_MACRO,
-            source_name=f"FRED ({series_id})",
-            errors_list=result["errors"]
+
+def _fred_observations(series_id: str, **params) -> List[Dict[str, str]]:
+    """
+    Raw `observations` rows of a FRED series from the REST API (JSON).
+    
+    Errors are raised as ValueError("FRED <series>: ...") built without the
+    request URL: its query string carries the API key, and these messages end
+    up in CountryMetrics.errors and on stdout.
+    """
+    try:
+        response = _FRED_SESSION.get(
+            _FRED_OBSERVATIONS_URL,
+            params={
+                "series_id": series_id,
+                "api_key": config.get_fred_api_key(),
+                "file_type": "json",
+                **params,
+            },
+            timeout=15
         )
-        result[key] = val
+    except requests.RequestException as e:
+        # Connection and retry-exhausted errors embed the full URL in their text
+        reason = "retries exhausted" if isinstance(e, requests.exceptions.RetryError) else type(e).__name__
+        raise ValueError(f"FRED {series_id}: {reason}") from None
+    if not response.ok:
+        try:
+            message = orjson.loads(response.content).get("error_message", response.reason)
+        except (orjson.JSONDecodeError, AttributeError):
+            message = response.reason
+        raise ValueError(f"FRED {series_id}: HTTP {response.status_code} {message}")
+    return orjson.loads(response.content).get("observations", [])
+
+
+def _fred_value(observation: Dict[str, str]) -> Optional[float]:
+    """Observation value as float (FRED marks missing values with ".")."""
+    value = observation.get("value")
+    return float(value) if value not in (None, "", ".") else None
 
 
-def _fetch_json_metrics(country_config: dict, result: dict):
+def fetch_fred_latest(series_id: str) -> Optional[float]:
+    """
+    Fetch the most recent non-missing observation of a FRED series.
+    
+    Reads the raw series/observations JSON (newest first, a handful of rows)
+    instead of building a pandas Series of the history for a single float.
+    
+    Returns:
+        Latest value as float, or None if the series has no recent data
+    """
+    for observation in _fred_observations(series_id, sort_order="desc", limit=_FRED_LATEST_LIMIT):
+        value = _fred_value(observation)
+        if value is not None:
+            return value
+    return None
+
+
+def fetch_fred_history(
+    series_id: str,
+    observation_start: Optional[datetime] = None,
+    observation_end: Optional[datetime] = None
+) -> pd.Series:
+    """
+    Fetch a FRED series as a pandas Series (Date index, NaN for missing values).
+    
+    Args:
+        series_id: FRED series ID (e.g., "WALCL")
+        observation_start: First date to include (default: series start)
+        observation_end: Last date to include (default: latest)
+    """
+    import pandas as pd
+    
+    params = {}
+    if observation_start is not None:
+        params["observation_start"] = observation_start.strftime("%Y-%m-%d")
+    if observation_end is not None:
+        params["observation_end"] = observation_end.strftime("%Y-%m-%d")
+        
+    observations = _fred_observations(series_id, **params)
+    return pd.Series(
+        [_fred_value(o) for o in observations],
+        index=pd.to_datetime([o["date"] for o in observations]),
+        dtype=float,
+        name=series_id
+    )
+
+
+def _fetch_json_metrics(country_code: str, result: CountryMetrics):
     """Fetch metrics from local JSON file."""
-    json_path = config.PROJECT_ROOT / "data" / country_config.get("json_path", "")
+    country_config = config.COUNTRIES[country_code]
+    json_path = os.path.join(config.DATA_DIR, country_config.get("json_path", ""))
     mapping = country_config.get("json_keys", {})
     
-    if json_path.exists():
+    try:
+        mtime_ns = os.stat(json_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+        
+    if mtime_ns is not None:
         try:
-            with open(json_path, "r") as f:
-                data = json.load(f)
+            # Re-read and parse only when the file has changed since last load
+            cached = _JSON_CACHE.get(json_path)
+            if cached is not None and cached[0] == mtime_ns:
+                data = cached[1]
+            else:
+                with open(json_path, "rb") as f:
+                    data = orjson.loads(f.read())
+                _JSON_CACHE[json_path] = (mtime_ns, data)
             
             # Map JSON keys to standard result keys
             for std_key, json_key in mapping.items():
                 if json_key in data:
-                    result[std_key] = data[json_key]
+                    setattr(result, std_key, data[json_key])
                     
             if "last_updated" in data:
-                result["last_updated"] = data["last_updated"]
+                result.last_updated = data["last_updated"]
                 
         except Exception as e:
-            result["errors"].append(f"JSON load error: {str(e)}")
+            result.errors.append(f"JSON load error: {str(e)}")
     else:
-        result["errors"].append(f"JSON file not found: {json_path}")
+        result.errors.append(f"JSON file not found: {json_path}")
 
 
-def _fetch_live_market_data(country_config: dict, result: dict):
-    """Fetch live market data (Yields, FX, Gold) from YFinance."""
-    metrics_map = country_config.get("metrics", {})
+def fetch_tickers_batch(tickers: List[str]) -> Dict[str, float]:
+    """
+    Fetch the latest close for several YFinance tickers in one batched request.
     
-    def fetch_ticker(ticker):
-        t = yf.Ticker(ticker)
-        hist = t.history(period="1d")
-        if not hist.empty:
-            return float(hist["Close"].iloc[-1])
-        return None
+    Returns:
+        Dict mapping ticker to last close (tickers without data are omitted)
+    """
+    import pandas as pd
+    import yfinance as yf
+    
+    data = yf.download(
+        tickers=list(tickers), period="1d", progress=False, group_by="ticker", threads=True
+    )
+    quotes = {}
+    if data is None or data.empty:
+        return quotes
+        
+    for ticker in tickers:
+        frame = data[ticker] if isinstance(data.columns, pd.MultiIndex) else data
+        closes = frame["Close"].dropna()
+        if not closes.empty:
+            quotes[ticker] = float(closes.iloc[-1])
+    return quotes
+
+
+def _batched_quote_fetcher(tickers: List[str]) -> callable:
+    """
+    Build a per-ticker fetch function backed by a single fetch_tickers_batch call.
+    
+    The first cache miss downloads every ticker in the group; later misses
+    reuse that result (or re-raise its error), so cache hits cost no request.
+    """
+    lock = threading.Lock()
+    state = {}
+    
+    def fetch(ticker: str) -> Optional[float]:
+        with lock:
+            if not state:
+                try:
+                    state["quotes"] = fetch_tickers_batch(tickers)
+                except Exception as e:
+                    state["error"] = e
+        if "error" in state:
+            raise state["error"]
+        return state["quotes"].get(ticker)
+    
+    return fetch
+
+
+def _fetch_live_market_data(country_code: str, result: CountryMetrics):
+    """Fetch live market data (Yields, FX, Gold) from YFinance."""
+    tickers = _MARKET_TICKERS.get(country_code, {})
+    fetch_ticker = _batched_quote_fetcher(sorted(set(tickers.values())))
+
+    pending_writes = []
 
-    # Helper to process a metric key
-    def process_ticker_metric(metric_key):
-        if metric_key in metrics_map:
-            ticker = metrics_map[metric_key]
-            # Only process if it LOOKS like a ticker (contains ^ or =)
-            # Exception: US 10Y is ^TNX, SA is ZAR=X.
-            # But FRED IDs are just alphanum.
-            if ticker and (str(ticker).startswith("^") or "=" in str(ticker)):
-                val = get_cached_or_fetch(
-                    key=ticker,
-                    fetch_func=lambda t=ticker: fetch_ticker(t),
-                    expiry_seconds=config.CACHE_EXPIRY_MARKET,
-                    source_name=f"YFinance {ticker}",
-                    errors_list=result["errors"]
-                )
-                if val is not None:
-                    result[metric_key] = val
-
-    # Check for specific market metrics
-    process_ticker_metric("yield_10y")
-    process_ticker_metric("usd_zar")
-    process_ticker_metric("gold")
+    for metric_key, ticker in tickers.items():
+        val = get_cached_or_fetch(
+            key=ticker,
+            fetch_func=partial(fetch_ticker, ticker),
+            expiry_seconds=config.CACHE_EXPIRY_MARKET,
+            source_name=f"YFinance {ticker}",
+            errors_list=result.errors,
+            pending_writes=pending_writes
+        )
+        if val is not None:
+            setattr(result, metric_key, val)
+            
+    db.set_metrics_bulk(pending_writes)
+
+
+# Source dispatch per country, resolved once from its source_type.
+# Live market data (Yields/FX) is always fetched if configured.
+_SOURCE_FETCHERS = {
+    "FRED_API": _fetch_fred_metrics,
+    "MANUAL_JSON": _fetch_json_metrics,
+}
+_COUNTRY_FETCHERS = {
+    code: tuple(
+        f for f in (_SOURCE_FETCHERS.get(country.get("source_type")), _fetch_live_market_data) if f
+    )
+    for code, country in config.COUNTRIES.items()
+}
 
 
 def get_yield_curve_data(country_code: str) -> Optional[Dict[str, float]]:
@@ -271,32 +576,73 @@ def get_yield_curve_data(country_code: str) -> Optional[Dict[str, float]]:
         return None
         
     result = {}
-    
-    def fetch_ticker(ticker):
-        try:
-            t = yf.Ticker(ticker)
-            hist = t.history(period="1d")
-            if not hist.empty:
-                return float(hist["Close"].iloc[-1])
-        except:
-            pass
-        return None
+    # Every maturity that misses the cache is served by one batched download
+    fetch_ticker = _batched_quote_fetcher(sorted(set(curve_config.values())))
+    pending_writes = []
 
     for label, ticker in curve_config.items():
         # Short expiry cache for yields
         val = get_cached_or_fetch(
             key=f"yield_{ticker}",
-            fetch_func=lambda t=ticker: fetch_ticker(t),
+            fetch_func=partial(fetch_ticker, ticker),
             expiry_seconds=config.CACHE_EXPIRY_MARKET,
             source_name=f"Yield {label}",
-            errors_list=[]
+            errors_list=[],
+            pending_writes=pending_writes
         )
         if val is not None:
             result[label] = val
             
+    db.set_metrics_bulk(pending_writes)
     return result if result else None
 
 
+def _single_flight(key: str, func: callable) -> Any:
+    """
+    Run func() for `key`, or wait for the call already in flight for it.
+    
+    Followers receive the leader's result (or exception) instead of
+    repeating the same download.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _INFLIGHT[key] = Future()
+            
+    if not is_leader:
+        return future.result()
+        
+    try:
+        result = func()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _period_offset(period: str) -> pd.DateOffset:
+    """Convert a YFinance period string ("6mo", "1y", "30d") to a DateOffset."""
+    import pandas as pd
+    if period.endswith("mo"):
+        return pd.DateOffset(months=int(period[:-2]))
+    if period.endswith("y"):
+        return pd.DateOffset(years=int(period[:-1]))
+    if period.endswith("d"):
+        return pd.DateOffset(days=int(period[:-1]))
+    raise ValueError(f"Unsupported period: {period}")
+
+
+def _now_like(ts: pd.Timestamp) -> pd.Timestamp:
+    """Current time in the same timezone (or naive) as `ts`, so they compare."""
+    import pandas as pd
+    return pd.Timestamp.now(tz=ts.tz)
+
+
 def get_historical_data(ticker_symbol: str, period: str = "6mo") -> Optional[pd.DataFrame]:
     """
     Fetch historical price data for charting.
@@ -308,20 +654,70 @@ def get_historical_data(ticker_symbol: str, period: str = "6mo") -> Optional[pd.
     Returns:
         DataFrame with Date index and Close prices, or None on error
     """
+    # One cache entry per (ticker, period) so different windows don't evict
+    # each other (or the 5y S&P series kept under the bare ticker for SQL)
+    cache_key = f"{ticker_symbol}_{period}"
+    # Concurrent callers for the same chart share one load/download
+    return _single_flight(cache_key, partial(_load_historical_data, ticker_symbol, period, cache_key))
+
+
+def get_historical_data_multi(ticker_symbols: List[str], period: str = "6mo") -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Fetch historical data for several tickers at once (e.g. comparison charts).
+    
+    Cache misses download concurrently, so N tickers cost about one
+    round-trip instead of N.
+    
+    Returns:
+        Dict mapping ticker to its DataFrame (or None), in the order requested
+    """
+    if not ticker_symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(ticker_symbols)) as executor:
+        futures = {t: executor.submit(get_historical_data, t, period) for t in ticker_symbols}
+        return {t: future.result() for t, future in futures.items()}
+
+
+def _load_historical_data(ticker_symbol: str, period: str, cache_key: str) -> Optional[pd.DataFrame]:
+    """Cache-or-download body of get_historical_data (runs once per in-flight key)."""
+    import pandas as pd
     
     # Check cache
-    cached = db.get_chart(ticker_symbol)
+    cached = db.get_chart(cache_key)
     if cached and is_fresh(cached['timestamp'], config.CACHE_EXPIRY_MARKET):
         return cached['data']
 
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        hist = ticker.history(period=period)
-        if not hist.empty:
+        ticker = _get_ticker(ticker_symbol)
+        last_bar = cached.get('last_bar_date') if cached else None
+        
+        incremental = False
+        if isinstance(last_bar, pd.Timestamp):
+            window_start = _now_like(last_bar) - _period_offset(period)
+            # Top up only a recent cache that already spans the requested window
+            incremental = (
+                _now_like(last_bar) - last_bar < timedelta(days=_HISTORY_INCREMENTAL_MAX_GAP_DAYS)
+                and cached['data'].index.min() - window_start < timedelta(days=_HISTORY_INCREMENTAL_MAX_GAP_DAYS)
+            )
+        
+        if incremental:
+            # Re-download from the last cached bar (it may have been cached
+            # mid-session), let the fresh copy replace it, then trim to the window
+            start_day = last_bar.normalize()
+            df = cached['data']
+            new_bars = ticker.history(start=start_day.strftime("%Y-%m-%d"))
+            if not new_bars.empty:
+                df = pd.concat([df, new_bars[["Close"]]])
+                df = df[~df.index.duplicated(keep="last")]
+            df = df[df.index >= window_start]
+        else:
+            hist = ticker.history(period=period)
+            if hist.empty:
+                return None
             df = hist[["Close"]]
-            db.set_chart(ticker_symbol, df)
-            return df
-        return None
+            
+        db.set_chart(cache_key, df)
+        return df
     except Exception as e:
         print(f"Error fetching historical data for {ticker_symbol}: {e}")
         # Return stale if available
@@ -333,45 +729,46 @@ def fetch_net_liquidity_components(years: int = 5) -> bool:
     """
     Fetch and cache the components for Net Liquidity.
     """
-    fred = get_fred_client()
-    if not fred: return False
+    if not fred_enabled(): return False
     
     # Define time range
     end_date = datetime.now()
     start_date = end_date - timedelta(days=years*365)
     
+    def fetch_fred_frame(series_id):
+        series = fetch_fred_history(series_id, start_date, end_date)
+        if series is None or series.empty:
+            return None
+        # Convert to DataFrame
+        df = series.to_frame(name="Value")
+        df.index.name = "Date"
+        return df
+    
+    def fetch_sp500_frame(ticker):
+        # Fetch history (YFinance accepts string for start/end)
+        hist = _get_ticker(ticker).history(start=start_date.strftime("%Y-%m-%d"), end=end_date.strftime("%Y-%m-%d"))
+        if hist.empty:
+            return None
+        df = hist[["Close"]]
+        df.index.name = "Date" # Ensure index name is set
+        return df
+    
+    # 1. FRED Series (Global/US Liquidity) keyed by series ID (consistent with
+    #    usage in SQL), 2. S&P 500 -- all independent, so fetch them together
+    jobs = {config.GLOBAL_SERIES[key]: fetch_fred_frame for key in ("fed_assets", "tga", "reverse_repo")}
+    jobs[config.GLOBAL_SERIES["sp500"]] = fetch_sp500_frame
+    
     try:
-        # 1. Fetch FRED Series (Global/US Liquidity)
-        for key in ["fed_assets", "tga", "reverse_repo"]:
-            series_id = config.GLOBAL_SERIES[key]
-            # Fetch from FRED
-            series = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {key: executor.submit(fetch, key) for key, fetch in jobs.items()}
+            frames = {key: future.result() for key, future in futures.items()}
             
-            if series is not None and not series.empty:
-                # Convert to DataFrame
-                df = series.to_frame(name="Value")
-                df.index.name = "Date"
-                
-                # Use series ID as cache key (consistent with usage in SQL)
-                db.set_chart(series_id, df)
-            else:
-                print(f"Warning: Empty data for {series_id}")
+        for key, df in frames.items():
+            if df is None:
+                print(f"Warning: Empty data for {key}")
                 return False
-
-        # 2. Fetch S&P 500
-        sp500_ticker = config.GLOBAL_SERIES["sp500"]
-        sp500 = yf.Ticker(sp500_ticker)
-        # Fetch history (YFinance accepts string for start/end)
-        sp500_hist = sp500.history(start=start_date.strftime("%Y-%m-%d"), end=end_date.strftime("%Y-%m-%d"))
-        
-        if not sp500_hist.empty:
-            df_sp = sp500_hist[["Close"]]
-            df_sp.index.name = "Date" # Ensure index name is set
-            db.set_chart(sp500_ticker, df_sp)
-        else:
-             print(f"Warning: Empty data for {sp500_ticker}")
-             return False
-             
+                
+        db.set_charts_bulk(frames)
         return True
         
     except Exception as e:
@@ -399,33 +796,59 @@ def get_net_liquidity_data() -> Optional[pd.DataFrame]:
             return None
             
     # 2. Execute DuckDB Query
-    conn = db.get_duckdb_connection()
-    
     # Construct paths to parquet files
-    def get_path(ticker):
-        safe_ticker = ticker.replace("^", "").replace("=", "").replace("/", "_")
-        return str(config.DATA_DIR / "cache" / f"{safe_ticker}.parquet")
+    path_walcl = db.chart_path(config.GLOBAL_SERIES["fed_assets"])
+    path_tga = db.chart_path(config.GLOBAL_SERIES["tga"])
+    path_rrp = db.chart_path(config.GLOBAL_SERIES["reverse_repo"])
+    path_sp500 = db.chart_path(config.GLOBAL_SERIES["sp500"])
     
-    path_walcl = get_path(config.GLOBAL_SERIES["fed_assets"])
-    path_tga = get_path(config.GLOBAL_SERIES["tga"])
-    path_rrp = get_path(config.GLOBAL_SERIES["reverse_repo"])
-    path_sp500 = get_path(config.GLOBAL_SERIES["sp500"])
+    # Reuse the last result until any input Parquet file is rewritten
+    try:
+        inputs_key = tuple(os.stat(p).st_mtime_ns for p in (path_walcl, path_tga, path_rrp, path_sp500))
+    except OSError:
+        inputs_key = None
+    if inputs_key is not None and _NET_LIQUIDITY_RESULT.get("key") == inputs_key:
+        return _NET_LIQUIDITY_RESULT["data"]
+    
+    conn = db.get_duckdb_connection()
+    
+    # Only rows from just before the S&P range can match (14 days of slack keep
+    # the prior weekly observation for the earliest S&P dates). The bound is
+    # resolved first and inlined as a literal: a constant filter is pushed into
+    # the Parquet scans and prunes row groups by their statistics, which a
+    # scalar subquery over the S&P CTE would not be.
+    try:
+        start = conn.execute(
+            f"SELECT CAST(MIN(Date) AS DATE) - 14 FROM read_parquet('{path_sp500}')"
+        ).fetchone()[0]
+    except Exception as e:
+        print(f"DuckDB Query Error: {e}")
+        conn.close()
+        return None
+    if start is None:
+        conn.close()
+        return None
     
     query = f"""
         WITH 
-        fed AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_walcl}')),
-        tga AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_tga}')),
-        rrp AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_rrp}')),
         sp  AS (SELECT CAST(Date AS DATE) as d, Close as val FROM read_parquet('{path_sp500}')),
+        fed AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_walcl}') WHERE Date >= DATE '{start}'),
+        tga AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_tga}') WHERE Date >= DATE '{start}'),
+        rrp AS (SELECT CAST(Date AS DATE) as d, Value as val FROM read_parquet('{path_rrp}') WHERE Date >= DATE '{start}'),
         
+        -- Latest fed/tga/rrp observation on or before each S&P date
+        -- (ASOF joins: one sorted merge per series, not a subquery per row)
         aligned AS (
             SELECT 
                 sp.d as Date,
                 sp.val as SP500,
-                (SELECT val FROM fed WHERE d <= sp.d ORDER BY d DESC LIMIT 1) as walcl,
-                (SELECT val FROM tga WHERE d <= sp.d ORDER BY d DESC LIMIT 1) as tga_val,
-                (SELECT val FROM rrp WHERE d <= sp.d ORDER BY d DESC LIMIT 1) as rrp_val
+                fed.val as walcl,
+                tga.val as tga_val,
+                rrp.val as rrp_val
             FROM sp
+            ASOF LEFT JOIN fed ON sp.d >= fed.d
+            ASOF LEFT JOIN tga ON sp.d >= tga.d
+            ASOF LEFT JOIN rrp ON sp.d >= rrp.d
         )
         SELECT
             Date,
@@ -445,6 +868,7 @@ def get_net_liquidity_data() -> Optional[pd.DataFrame]:
         
         if not df_result.empty:
             df_result.set_index('Date', inplace=True)
+            _NET_LIQUIDITY_RESULT.update(key=inputs_key, data=df_result)
             return df_result
         return None
         
@@ -457,23 +881,21 @@ def fetch_fiscal_history(years: int = 10) -> bool:
     """
     Fetch and cache historical Interest Payments and Tax Receipts for regression.
     """
-    fred = get_fred_client()
-    if not fred: return False
+    if not fred_enabled(): return False
     
     # Define time range
     end_date = datetime.now()
     start_date = end_date - timedelta(days=years*365)
     
     try:
-        us_metrics = config.COUNTRIES["US"]["metrics"]
         series_map = {
-            "interest_payments": us_metrics["interest_payments"],
-            "tax_receipts": us_metrics["tax_receipts"]
+            "interest_payments": config.METRIC_INDEX["US", "interest_payments"],
+            "tax_receipts": config.METRIC_INDEX["US", "tax_receipts"]
         }
         
         for key, series_id in series_map.items():
             # Fetch from FRED
-            series = fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
+            series = fetch_fred_history(series_id, start_date, end_date)
             
             if series is not None and not series.empty:
                 # Convert to DataFrame
@@ -485,7 +907,9 @@ def fetch_fiscal_history(years: int = 10) -> bool:
             else:
                 print(f"Warning: Empty data for {series_id}")
                 return False
-                
+        
+        # The regression query reads these files directly: wait for the writes
+        db.flush()
         return True
         
     except Exception as e:
@@ -495,19 +919,25 @@ def fetch_fiscal_history(years: int = 10) -> bool:
 def get_fiscal_history_data() -> Optional[pd.DataFrame]:
     """
     Retrieve historical Interest Payments and Tax Receipts joined by Date.
-    """
-    conn = db.get_duckdb_connection()
     
-    us_metrics = config.COUNTRIES["US"]["metrics"]
-    key_int = us_metrics["interest_payments"]
-    key_tax = us_metrics["tax_receipts"]
+    The joined frame is reused until either Parquet file is rewritten; callers
+    must treat it as read-only.
+    """
+    key_int = config.METRIC_INDEX["US", "interest_payments"]
+    key_tax = config.METRIC_INDEX["US", "tax_receipts"]
     
     # Construct paths
-    def get_path(series_id):
-        return str(config.DATA_DIR / "cache" / f"{series_id}.parquet")
-        
-    path_int = get_path(key_int)
-    path_tax = get_path(key_tax)
+    path_int = db.chart_path(key_int)
+    path_tax = db.chart_path(key_tax)
+    
+    try:
+        inputs_key = (os.stat(path_int).st_mtime_ns, os.stat(path_tax).st_mtime_ns)
+    except OSError:
+        inputs_key = None
+    if inputs_key is not None and _FISCAL_HISTORY_RESULT.get("key") == inputs_key:
+        return _FISCAL_HISTORY_RESULT["data"]
+    
+    conn = db.get_duckdb_connection()
     
     query = f"""
         WITH 
@@ -529,6 +959,7 @@ def get_fiscal_history_data() -> Optional[pd.DataFrame]:
         conn.close()
         if not df.empty:
             df.set_index('Date', inplace=True)
+            _FISCAL_HISTORY_RESULT.update(key=inputs_key, data=df)
             return df
         return None
     except Exception as e:
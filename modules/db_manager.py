@@ -6,33 +6,86 @@ Handles DuckDB interactions for caching macroeconomic and market data.
 - Time-series charts are stored as Parquet files for high performance.
 """
 
+from __future__ import annotations
+
+import atexit
+import io
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import duckdb
-import pandas as pd
 from datetime import datetime
-from typing import Optional, Any, Dict
-from pathlib import Path
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd  # Imported on first chart read, off the startup path
 import config
 
+# Rows per Parquet row group for chart files (a few groups per multi-year series)
+_PARQUET_ROW_GROUP_SIZE = 256
+
+# Ticker -> filename sanitizer ("^GSPC" -> "GSPC", "ZAR=X" -> "ZARX")
+_TICKER_TRANS = str.maketrans({"^": "", "=": "", "/": "_"})
+
+
+@lru_cache(maxsize=None)
+def _safe_path(cache_dir: str, ticker: str) -> str:
+    """Parquet file path for a ticker's chart cache."""
+    return os.path.join(cache_dir, f"{ticker.translate(_TICKER_TRANS)}.parquet")
+
+
+def _to_epoch(timestamp: Any) -> Optional[float]:
+    """
+    Convert a stored TIMESTAMP to epoch seconds, comparable with time.time().
+    
+    Rows are written with the naive local datetime.now(), which .timestamp()
+    interprets as local time.
+    """
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return timestamp.timestamp()
+
+
 class DatabaseManager:
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Optional[str] = None):
         # If no path provided, use the one from config, but change extension to .duckdb
         if db_path is None:
-            self.db_path = config.DB_PATH.with_suffix('.duckdb')
+            self.db_path = os.path.splitext(config.DB_PATH)[0] + ".duckdb"
         else:
             self.db_path = db_path
             
-        self.cache_dir = config.DATA_DIR / "cache"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = config.CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
         self._shared_conn = None
+        self._connect_lock = threading.Lock()
+        # Parsed chart Parquet files: path -> (st_mtime_ns, DataFrame)
+        self._chart_frames: Dict[str, Tuple[int, pd.DataFrame]] = {}
+        # Background chart writes (file + metadata) queued by set_chart. One
+        # thread keeps writes FIFO and the metadata upserts free of conflicts.
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-writer")
+        self._pending_charts: Dict[str, Future] = {}
+        # Latest not-yet-written payload per ticker; repeated set_chart calls
+        # overwrite it so a burst of updates lands as one write
+        self._queued_payloads: Dict[str, Tuple[bytes, datetime]] = {}
+        self._pending_lock = threading.Lock()
 
     def _get_connection(self) -> duckdb.DuckDBPyConnection:
         """Get a cursor from the shared database connection."""
         if self._shared_conn is None:
-            try:
-                self._shared_conn = duckdb.connect(str(self.db_path))
-            except Exception as e:
-                # Fallback or retry logic could go here, but for now raise
-                raise IOError(f"Failed to connect to DuckDB at {self.db_path}: {e}")
+            # Worker threads may race here on first use: open the file only once
+            with self._connect_lock:
+                if self._shared_conn is None:
+                    try:
+                        self._shared_conn = duckdb.connect(str(self.db_path))
+                    except Exception as e:
+                        # Fallback or retry logic could go here, but for now raise
+                        raise IOError(f"Failed to connect to DuckDB at {self.db_path}: {e}")
+                    # Checkpoint and release the file lock cleanly on exit
+                    atexit.register(self._shared_conn.close)
         
         # Return a cursor so the caller can close it without closing the main connection
         return self._shared_conn.cursor()
@@ -74,6 +127,28 @@ class DatabaseManager:
         
         conn.close()
 
+    def set_metrics_bulk(self, items: List[Tuple[str, float, str]]) -> None:
+        """Store several (key, value, source) metrics in one transaction."""
+        if not items:
+            return
+        conn = self._get_connection()
+        timestamp = datetime.now()
+        
+        # One multi-row statement: a single implicit transaction and row-group
+        # write (DuckDB's executemany re-runs the statement once per row)
+        # Dedupe first: one statement may not upsert the same key twice
+        # (e.g. SA's yield_10y and usd_zar share the ZAR=X ticker)
+        rows = {key: (value, source) for key, value, source in items}
+        placeholders = ", ".join(["(?, ?, ?, ?)"] * len(rows))
+        params = [p for key, (value, source) in rows.items() for p in (key, value, timestamp, source)]
+        try:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO metric_cache (key, value, timestamp, source)
+                VALUES {placeholders}
+            """, params)
+        finally:
+            conn.close()
+
     def get_metric(self, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a metric from cache."""
         conn = self._get_connection()
@@ -88,39 +163,156 @@ class DatabaseManager:
         if result:
             return {
                 "value": result[0],
-                "timestamp": result[1].isoformat() if hasattr(result[1], 'isoformat') else str(result[1]),
+                "timestamp": _to_epoch(result[1]),
                 "source": result[2]
             }
         return None
 
-    def set_chart(self, ticker: str, df: pd.DataFrame) -> None:
-        """Store chart data as Parquet and update metadata."""
-        # Sanitize ticker for filename
-        safe_ticker = ticker.replace("^", "").replace("=", "").replace("/", "_")
-        file_path = self.cache_dir / f"{safe_ticker}.parquet"
+    def get_metrics_bulk(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several metrics from cache in a single query (missing keys are omitted)."""
+        if not keys:
+            return {}
+        conn = self._get_connection()
+        
+        placeholders = ", ".join("?" * len(keys))
+        rows = conn.execute(
+            f"SELECT key, value, timestamp, source FROM metric_cache WHERE key IN ({placeholders})",
+            list(keys)
+        ).fetchall()
         
+        conn.close()
+        
+        return {
+            key: {
+                "value": value,
+                "timestamp": _to_epoch(timestamp),
+                "source": source
+            }
+            for key, value, timestamp, source in rows
+        }
+
+    def chart_path(self, ticker: str) -> str:
+        """Path of the Parquet file backing a ticker's chart cache."""
+        return _safe_path(self.cache_dir, ticker)
+
+    def _serialize_chart(self, df: pd.DataFrame) -> bytes:
+        """Encode a chart as Parquet bytes in memory."""
         # Ensure index is saved as a column for SQL querying
         # If index has a name (e.g. "Date"), reset_index will make it a column
-        df_to_save = df.copy()
-        if df_to_save.index.name == "Date":
-            df_to_save = df_to_save.reset_index()
+        # (to_parquet never mutates, so no defensive copy is needed)
+        df_to_save = df.reset_index() if df.index.name == "Date" else df
         
-        # Save to Parquet
-        df_to_save.to_parquet(file_path)
+        # Save to Parquet, Date-sorted in small row groups so per-group min/max
+        # statistics let DuckDB skip groups outside a query's date range
+        if "Date" in df_to_save.columns:
+            df_to_save = df_to_save.sort_values("Date", kind="stable")
+        buffer = io.BytesIO()
+        df_to_save.to_parquet(buffer, row_group_size=_PARQUET_ROW_GROUP_SIZE)
+        return buffer.getvalue()
+
+    def _flush_chart_file(self, file_path: str, payload: bytes, durable: bool = False) -> None:
+        """
+        Write serialized chart bytes, swapping the file in atomically for readers.
         
-        # Update metadata
+        Each write gets its own temp file, so overlapping writes of one ticker
+        never share a partial file. durable fsyncs before the swap.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _write_chart_file(self, ticker: str, df: pd.DataFrame) -> None:
+        """Write one chart's Parquet file."""
+        self._flush_chart_file(self.chart_path(ticker), self._serialize_chart(df))
+
+    def set_charts_bulk(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """Store several charts: write the Parquet files concurrently, then upsert metadata in one transaction."""
+        if not frames:
+            return
+        # Callers query these files right away, so the writes stay synchronous
+        with ThreadPoolExecutor(max_workers=len(frames)) as executor:
+            for future in [executor.submit(self._write_chart_file, t, df) for t, df in frames.items()]:
+                future.result()
+                
         conn = self._get_connection()
         timestamp = datetime.now()
         
-        conn.execute("""
-            INSERT OR REPLACE INTO chart_metadata (ticker, timestamp)
-            VALUES (?, ?)
-        """, (ticker, timestamp))
+        placeholders = ", ".join(["(?, ?)"] * len(frames))
+        params = [p for ticker in frames for p in (ticker, timestamp)]
+        try:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO chart_metadata (ticker, timestamp)
+                VALUES {placeholders}
+            """, params)
+        finally:
+            conn.close()
+
+    def set_chart(self, ticker: str, df: pd.DataFrame) -> None:
+        """
+        Store chart data as Parquet and update metadata.
         
-        conn.close()
+        The frame is serialized in memory here; the file write (fsynced) and
+        metadata upsert run on the writer thread so the fetch path never waits
+        on disk. Updates to a ticker that is still queued replace the queued
+        payload instead of adding another write.
+        get_chart waits for a pending write of the same ticker; use flush()
+        before reading the files by other means (e.g. DuckDB read_parquet).
+        """
+        payload = self._serialize_chart(df)
+        timestamp = datetime.now()
+        with self._pending_lock:
+            queued = ticker in self._queued_payloads
+            self._queued_payloads[ticker] = (payload, timestamp)
+            if not queued:
+                self._pending_charts[ticker] = self._writer.submit(self._store_chart, ticker)
+
+    def _store_chart(self, ticker: str) -> None:
+        """Writer-thread half of set_chart: file first, then metadata."""
+        with self._pending_lock:
+            payload, timestamp = self._queued_payloads.pop(ticker)
+        try:
+            self._flush_chart_file(self.chart_path(ticker), payload, durable=True)
+            
+            # Update metadata
+            conn = self._get_connection()
+            try:
+                conn.execute("""
+                    INSERT OR REPLACE INTO chart_metadata (ticker, timestamp)
+                    VALUES (?, ?)
+                """, (ticker, timestamp))
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"Error writing chart cache for {ticker}: {e}")
+
+    def _wait_pending(self, ticker: str) -> None:
+        """Block until a queued set_chart for this ticker has landed."""
+        with self._pending_lock:
+            future = self._pending_charts.get(ticker)
+        if future is not None:
+            future.result()
+
+    def flush(self) -> None:
+        """Block until every queued chart write has landed on disk."""
+        # The writer is FIFO, so each ticker's newest future covers its older ones
+        with self._pending_lock:
+            futures = list(self._pending_charts.values())
+        wait(futures)
 
     def get_chart(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Retrieve chart data from Parquet cache."""
+        self._wait_pending(ticker)
         conn = self._get_connection()
         
         # Check metadata first
@@ -135,23 +327,32 @@ class DatabaseManager:
             return None
             
         timestamp = meta[0]
-        safe_ticker = ticker.replace("^", "").replace("=", "").replace("/", "_")
-        file_path = self.cache_dir / f"{safe_ticker}.parquet"
+        file_path = self.chart_path(ticker)
         
-        if not file_path.exists():
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
             return None
             
         try:
-            # Read Parquet
-            df = pd.read_parquet(file_path)
-            
-            # Restore index if Date column exists (compatibility with rest of app)
-            if "Date" in df.columns:
-                df = df.set_index("Date")
+            # Reuse the parsed frame until set_chart rewrites the file
+            loaded = self._chart_frames.get(file_path)
+            if loaded is not None and loaded[0] == mtime_ns:
+                df = loaded[1]
+            else:
+                # Read Parquet
+                import pandas as pd
+                df = pd.read_parquet(file_path)
+                
+                # Restore index if Date column exists (compatibility with rest of app)
+                if "Date" in df.columns:
+                    df = df.set_index("Date")
+                self._chart_frames[file_path] = (mtime_ns, df)
             
             return {
                 "data": df,
-                "timestamp": timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp)
+                "timestamp": _to_epoch(timestamp),
+                "last_bar_date": df.index.max() if not df.empty else None
             }
         except Exception as e:
             print(f"Error reading parquet for {ticker}: {e}")
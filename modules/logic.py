@@ -13,14 +13,32 @@ Advanced Analytics:
 - Doom Loop Regression Forecasting
 """
 
+from bisect import bisect_right
 from typing import Literal, Optional, Tuple
-from datetime import datetime, timedelta
-from sklearn.linear_model import LinearRegression
+from datetime import date
 
+import config
+from config import CURRENCY_RISK_CRITICAL, YIELD_10Y_VIGILANTE
 from modules import data_loader
 
 AlertStatus = Literal["SAFE", "WARNING", "CRITICAL"]
 
+# Status labels indexed by the number of (warning, critical) thresholds crossed
+_STATUS_LABELS: Tuple[AlertStatus, ...] = ("SAFE", "WARNING", "CRITICAL")
+
+# Proleptic Gregorian ordinal of 1970-01-01 (datetime64 day 0)
+_EPOCH_ORDINAL = 719163
+
+# Last Day Zero regression: ((rows, last date, last ratio), (slope, intercept)).
+# Replaced as one tuple so concurrent readers never pair a key with another fit.
+_DOOM_LOOP_FIT: Optional[Tuple[tuple, Tuple[float, float]]] = None
+
+# Debt/GDP ladders bound once at import (Developed = US, Emerging = SA)
+_US_THRESHOLDS = config.COUNTRY_CONFIGS["US"].thresholds
+_SA_THRESHOLDS = config.COUNTRY_CONFIGS["SA"].thresholds
+_DEBT_GDP_DEVELOPED = (_US_THRESHOLDS.debt_gdp_warning, _US_THRESHOLDS.debt_gdp_critical)
+_DEBT_GDP_EMERGING = (_SA_THRESHOLDS.debt_gdp_warning, _SA_THRESHOLDS.debt_gdp_critical)
+
 
 def calculate_interest_revenue_ratio(
     interest_expense: float,
@@ -138,6 +156,40 @@ def calculate_debt_to_gdp_ratio(
     return (total_debt / gdp) * 100
 
 
+# =============================================================================
+# Vectorized Ratios (time series / many countries at once)
+# =============================================================================
+# Array counterparts of the scalar functions above: same formulas, no Python
+# per-element branching. Zero denominators give inf, NaN inputs stay NaN.
+
+def _safe_divide(numerator, denominator):
+    """Element-wise numerator / denominator with inf where denominator == 0."""
+    import numpy as np
+    
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.full(np.broadcast(numerator, denominator).shape, np.inf)
+    return np.divide(numerator, denominator, out=out, where=denominator != 0)
+
+
+def calculate_interest_revenue_ratio_vec(interest_expense, tax_revenue):
+    """Vectorized calculate_interest_revenue_ratio (ratio as decimal)."""
+    return _safe_divide(interest_expense, tax_revenue)
+
+
+def calculate_debt_to_gdp_ratio_vec(total_debt, gdp):
+    """Vectorized calculate_debt_to_gdp_ratio (ratio as percentage)."""
+    return _safe_divide(total_debt, gdp) * 100
+
+
+def calculate_days_of_interest_vec(total_debt, avg_interest_rate):
+    """Vectorized calculate_days_of_interest (missing/NaN inputs give 0.0)."""
+    import numpy as np
+    
+    daily = (np.asarray(total_debt, dtype=float) * (np.asarray(avg_interest_rate, dtype=float) / 100.0)) / 365.0
+    return np.where(np.isnan(daily), 0.0, daily)
+
+
 # =============================================================================
 # Status Checkers
 # =============================================================================
@@ -158,11 +210,10 @@ def get_interest_ratio_status(
     Returns:
         AlertStatus: "SAFE", "WARNING", or "CRITICAL"
     """
-    if ratio >= critical_threshold:
-        return "CRITICAL"
-    elif ratio >= warning_threshold:
-        return "WARNING"
-    return "SAFE"
+    # NaN fails every >= comparison (SAFE), but bisect would sort it past the ladder
+    if ratio != ratio:
+        return "SAFE"
+    return _STATUS_LABELS[bisect_right((warning_threshold, critical_threshold), ratio)]
 
 
 def get_growth_spread_status(spread: float) -> AlertStatus:
@@ -195,12 +246,12 @@ def get_yield_curve_status(spread: float) -> AlertStatus:
     return "SAFE"
 
 
-def get_bond_vigilante_status(bond_yield: float, threshold: float = 5.0) -> bool:
+def get_bond_vigilante_status(bond_yield: float, threshold: float = YIELD_10Y_VIGILANTE) -> bool:
     """Check for Bond Vigilante Attack (Yield Spike)."""
     return bond_yield > threshold
 
 
-def get_currency_risk_status(usd_zar: float, threshold: float = 19.0) -> bool:
+def get_currency_risk_status(usd_zar: float, threshold: float = CURRENCY_RISK_CRITICAL) -> bool:
     """Check for Currency Crisis."""
     return usd_zar > threshold
 
@@ -216,16 +267,70 @@ def get_debt_gdp_status(
     - Developed (US): Warning > 100%, Critical > 120%
     - Emerging (SA): Warning > 70%, Critical > 90%
     """
-    if is_emerging_market:
-        warn, crit = 70.0, 90.0
-    else:
-        warn, crit = 100.0, 120.0
-        
-    if ratio >= crit:
-        return "CRITICAL"
-    elif ratio >= warn:
-        return "WARNING"
-    return "SAFE"
+    # NaN fails every >= comparison (SAFE), but bisect would sort it past the ladder
+    if ratio != ratio:
+        return "SAFE"
+    # bisect_right counts a ratio equal to a threshold as crossed (>=)
+    ladder = _DEBT_GDP_EMERGING if is_emerging_market else _DEBT_GDP_DEVELOPED
+    return _STATUS_LABELS[bisect_right(ladder, ratio)]
+
+
+# Array counterparts of the checkers above for classifying whole series at
+# once; each returns an array of labels (or booleans) shaped like the input.
+
+def _status_vec(values, ladder: Tuple[float, float]):
+    """
+    Label each value by how many ladder thresholds it crosses (bisect_right
+    semantics); NaN is SAFE, like the scalar checkers.
+    """
+    import numpy as np
+    
+    values = np.asarray(values, dtype=float)
+    # searchsorted sorts NaN past every threshold: count it as crossing none
+    crossed = np.where(np.isnan(values), 0, np.searchsorted(ladder, values, side="right"))
+    return np.array(_STATUS_LABELS)[crossed]
+
+
+def get_interest_ratio_status_vec(
+    ratios,
+    warning_threshold: float = 0.15,
+    critical_threshold: float = 0.20
+):
+    """Vectorized get_interest_ratio_status."""
+    return _status_vec(ratios, (warning_threshold, critical_threshold))
+
+
+def get_debt_gdp_status_vec(ratios, is_emerging_market: bool = False):
+    """Vectorized get_debt_gdp_status."""
+    return _status_vec(ratios, _DEBT_GDP_EMERGING if is_emerging_market else _DEBT_GDP_DEVELOPED)
+
+
+def get_growth_spread_status_vec(spreads):
+    """Vectorized get_growth_spread_status."""
+    import numpy as np
+    
+    return np.where(np.asarray(spreads, dtype=float) > 0, "CRITICAL", "SAFE")
+
+
+def get_yield_curve_status_vec(spreads):
+    """Vectorized get_yield_curve_status."""
+    import numpy as np
+    
+    return np.where(np.asarray(spreads, dtype=float) < 0, "CRITICAL", "SAFE")
+
+
+def get_bond_vigilante_status_vec(bond_yields, threshold: float = YIELD_10Y_VIGILANTE):
+    """Vectorized get_bond_vigilante_status."""
+    import numpy as np
+    
+    return np.asarray(bond_yields, dtype=float) > threshold
+
+
+def get_currency_risk_status_vec(usd_zar, threshold: float = CURRENCY_RISK_CRITICAL):
+    """Vectorized get_currency_risk_status."""
+    import numpy as np
+    
+    return np.asarray(usd_zar, dtype=float) > threshold
 
 
 # =============================================================================
@@ -257,6 +362,28 @@ def calculate_fed_rate_expectation(
     return nominal_10y - term_premium_10y
 
 
+def _fit_line(df) -> Tuple[float, float]:
+    """
+    Ordinary least squares fit of ratio vs ordinal date.
+    
+    Returns:
+        (slope, intercept) of ratio = slope * date_ordinal + intercept
+    """
+    import numpy as np
+    
+    # Ordinal date, vectorized: whole days since the Unix epoch plus
+    # date(1970, 1, 1).toordinal() (any datetime64 unit, no per-row calls)
+    x = (df.index.to_numpy().astype("datetime64[D]").astype(np.int64) + _EPOCH_ORDINAL).astype(float)
+    y = df['ratio'].to_numpy(dtype=float)
+    
+    # Closed-form single-feature OLS on centred data (ordinals are ~7e5, so
+    # centring keeps the sums well-conditioned)
+    dx = x - x.mean()
+    y_mean = y.mean()
+    slope = np.dot(dx, y - y_mean) / np.dot(dx, dx)
+    return float(slope), float(y_mean - slope * x.mean())
+
+
 def predict_doom_loop_day_zero() -> Tuple[Optional[float], Optional[str]]:
     """
     Predict when Interest will consume 100% of Tax Revenue (Ratio = 1.0).
@@ -288,19 +415,13 @@ def predict_doom_loop_day_zero() -> Tuple[Optional[float], Optional[str]]:
     if len(df) < 10:
         return None, "Insufficient Data Points"
         
-    # Create ordinal date
-    # Fix: Wrap toordinal in lambda to avoid TypeError
-    df['date_ordinal'] = df.index.map(lambda x: x.toordinal())
-    
-    X = df['date_ordinal'].values.reshape(-1, 1)
-    y = df['ratio'].values
-    
-    # 3. Fit Model
-    model = LinearRegression()
-    model.fit(X, y)
-    
-    slope = model.coef_[0]
-    intercept = model.intercept_
+    # 3. Fit Model (reused until the fiscal history changes)
+    global _DOOM_LOOP_FIT
+    fit_key = (len(df), df.index[-1], float(df['ratio'].iat[-1]))
+    fit = _DOOM_LOOP_FIT
+    if fit is None or fit[0] != fit_key:
+        fit = _DOOM_LOOP_FIT = (fit_key, _fit_line(df))
+    slope, intercept = fit[1]
     
     # 4. Solve for y = 1.0
     # 1.0 = slope * x + intercept
@@ -312,16 +433,15 @@ def predict_doom_loop_day_zero() -> Tuple[Optional[float], Optional[str]]:
     day_zero_ordinal = (1.0 - intercept) / slope
     
     try:
-        day_zero_date = datetime.fromordinal(int(day_zero_ordinal))
-        now = datetime.now()
-        
-        days_remaining = (day_zero_date - now).days
+        # Whole-day delta straight from ordinals; a date is built only for display
+        day_zero = int(day_zero_ordinal)
+        days_remaining = day_zero - date.today().toordinal()
         years_remaining = days_remaining / 365.25
         
         if years_remaining < 0:
              return 0.0, "Already Passed!"
              
-        return years_remaining, day_zero_date.strftime("%Y-%m-%d")
+        return years_remaining, date.fromordinal(day_zero).strftime("%Y-%m-%d")
         
     except Exception as e:
         return None, f"Calculation Error: {e}"
@@ -7,9 +7,16 @@ Supports two modes:
 - Full Charts: Detailed charts with axes, labels, and grid
 """
 
-from typing import Optional
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import partial, wraps
+from typing import Callable, Optional
 import plotext as plt
 
+import config
 from modules import data_loader
 
 
@@ -21,6 +28,126 @@ TICKER_LABELS = {
     "^GSPC": "S&P 500",
 }
 
+# Liquidity correlation verdicts by how many cut-offs the correlation exceeds
+# (bisect_left: strictly greater; NaN falls through to LOW)
+_CORRELATION_LADDER = (0.4, 0.7)
+_CORRELATION_VERDICTS = (
+    "[green]LOW CORRELATION[/green] (Market decoupled)",
+    "[yellow]MODERATE CORRELATION[/yellow]",
+    "[red]HIGH CORRELATION[/red] (Liquidity driving market)",
+)
+
+# Yield curve maturities, shortest first
+_TENOR_ORDER = ("3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y")
+_TENOR_RANK = {tenor: i for i, tenor in enumerate(_TENOR_ORDER)}
+
+
+def _tenor_rank(tenor: str) -> int:
+    """Sort rank of a maturity label (unknown labels sort last)."""
+    return _TENOR_RANK.get(tenor, len(_TENOR_ORDER))
+
+
+# plotext draws into one module-level figure, so concurrent workers (one per
+# dashboard) must not interleave their clf()/plot()/build() sequences
+_PLOT_LOCK = threading.RLock()
+
+
+@contextmanager
+def _plot_figure(width: Optional[int] = None, height: Optional[int] = None, theme: str = "dark"):
+    """
+    Hold the plot lock for one figure: clear it, apply size and theme, and
+    clear it again afterwards even if drawing fails.
+    
+    plotext's clf() resets size and theme along with the data, so they are
+    re-applied per figure rather than cached between calls.
+    """
+    with _PLOT_LOCK:
+        plt.clf()
+        if width is not None:
+            plt.plotsize(width, height)
+            plt.theme(theme)
+        try:
+            yield
+        finally:
+            plt.clf()
+
+
+def _ttl_memoize(ttl_seconds: int):
+    """
+    Memoize a chart builder's output for `ttl_seconds`, keyed on its arguments.
+    
+    Placeholder/error strings ("[...]") are not cached so a chart appears as
+    soon as its data does. List arguments (ticker lists) are keyed as tuples.
+    """
+    def decorator(func):
+        cache = {}
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (
+                tuple(tuple(a) if isinstance(a, list) else a for a in args),
+                tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()))
+            )
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl_seconds:
+                return hit[1]
+            
+            result = func(*args, **kwargs)
+            if not result.startswith("["):
+                cache[key] = (now, result)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+# Rendered chart strings keyed on (builder, arguments, data version): once a
+# TTL expires, unchanged data is served without another plotext build
+_RENDERED: "OrderedDict[tuple, str]" = OrderedDict()
+_RENDERED_MAX = 64
+
+
+def _frame_version(df) -> tuple:
+    """Cheap fingerprint of a history frame: changes whenever a bar is added or revised."""
+    return (len(df), df.index[-1], float(df["Close"].iat[-1]))
+
+
+def _render_once(key: tuple, render: Callable[[], str]) -> str:
+    """Return the chart string for `key`, calling `render()` only on a miss."""
+    with _PLOT_LOCK:
+        hit = _RENDERED.get(key)
+        if hit is not None:
+            _RENDERED.move_to_end(key)
+            return hit
+    
+    result = render()
+    if not result.startswith("["):
+        with _PLOT_LOCK:
+            _RENDERED[key] = result
+            if len(_RENDERED) > _RENDERED_MAX:
+                _RENDERED.popitem(last=False)
+    return result
+
+
+def _downsample(values, target: int):
+    """
+    Thin a series to at most `target` points (linear interpolation) for plotting.
+    
+    Returns:
+        (x, y) arrays; x stays in original row positions, so ticks placed on
+        the full series still line up
+    """
+    import numpy as np
+    
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n <= target:
+        return np.arange(n, dtype=float), values
+    x = np.linspace(0, n - 1, target)
+    return x, np.interp(x, np.arange(n), values)
+
 
 def _clean_chart_output(chart_str: str) -> str:
     """
@@ -29,20 +156,14 @@ def _clean_chart_output(chart_str: str) -> str:
     Removes trailing whitespace, extra blank lines, and normalizes line lengths.
     """
     # Split into lines, strip trailing whitespace from each
+    # (whitespace-only lines become "", so blank checks are plain truthiness)
     lines = [line.rstrip() for line in chart_str.split('\n')]
     
-    # Remove trailing empty lines
-    while lines and not lines[-1].strip():
-        lines.pop()
-    
-    # Remove leading empty lines  
-    while lines and not lines[0].strip():
-        lines.pop(0)
-    
-    # Filter out any lines that are just whitespace
-    lines = [line for line in lines if line.strip() or line == '']
+    # Drop leading and trailing empty lines by slicing once
+    start = next((i for i, line in enumerate(lines) if line), len(lines))
+    end = next((len(lines) - i for i, line in enumerate(reversed(lines)) if line), start)
     
-    return '\n'.join(lines)
+    return '\n'.join(lines[start:end])
 
 
 def get_chart_title(ticker: str) -> str:
@@ -58,6 +179,7 @@ def get_chart_title(ticker: str) -> str:
     return TICKER_LABELS.get(ticker, ticker)
 
 
+@_ttl_memoize(config.CACHE_EXPIRY_MARKET)
 def build_sparkline(
     ticker: str,
     months: int = 6,
@@ -83,29 +205,72 @@ def build_sparkline(
     if df is None or df.empty:
         return f"[No data for {ticker}]"
     
+    render = _render_braille_sparkline if config.SPARKLINE_BRAILLE else _render_sparkline
+    return _render_once(
+        ("sparkline", ticker, months, width, height, _frame_version(df)),
+        partial(render, df, width, height)
+    )
+
+
+# Braille dot bits by (sub-row 0-3, sub-column 0-1) within a 2x4 cell
+_BRAILLE_DOTS = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+
+
+def _render_braille_sparkline(df, width: int, height: int) -> str:
+    """
+    Draw a sparkline of df["Close"] straight into braille cells, skipping plotext.
+    
+    Each character is a 2x4 dot cell, so the line is resampled to width * 2
+    columns on a height * 4 dot grid; consecutive points are joined vertically.
+    """
+    import numpy as np
+    
     try:
-        # Clear any previous plot
-        plt.clf()
-        
-        # Configure for sparkline (minimal chrome)
-        plt.plotsize(width, height)
-        plt.theme("dark")
-        
-        # Extract data
-        dates = list(range(len(df)))  # Use numeric x-axis for compactness
-        values = df["Close"].tolist()
+        values = df["Close"].to_numpy(dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0 or width < 1 or height < 1:
+            return "[No data for sparkline]"
+        
+        # Resample to one sample per dot column, then scale to dot rows (0 = top)
+        dot_cols, dot_rows = width * 2, height * 4
+        samples = np.interp(np.linspace(0, values.size - 1, dot_cols), np.arange(values.size), values)
+        span = samples.max() - samples.min()
+        scaled = (samples - samples.min()) / span if span else np.full(dot_cols, 0.5)
+        rows = ((dot_rows - 1) - np.rint(scaled * (dot_rows - 1)).astype(np.int64)).tolist()
+        
+        grid = [[0] * width for _ in range(height)]
+        prev = rows[0]
+        for col, row in enumerate(rows):
+            # Fill from the previous point so steep moves stay connected
+            lo, hi = (row, prev) if row <= prev else (prev, row)
+            for r in range(lo, hi + 1):
+                grid[r // 4][col // 2] |= _BRAILLE_DOTS[r % 4][col % 2]
+            prev = row
+        
+        return "\n".join("".join(chr(0x2800 + mask) for mask in line) for line in grid)
         
-        # Plot the line
-        plt.plot(dates, values, marker="braille")
-        
-        # Minimal axes - no labels for sparkline
-        plt.xaxes(False, False)
-        plt.yaxes(False, False)
-        plt.frame(False)
-        
-        # Build and return as string
-        chart_str = plt.build()
-        plt.clf()
+    except Exception as e:
+        return f"[Chart error: {str(e)}]"
+
+
+def _render_sparkline(df, width: int, height: int) -> str:
+    """Draw a sparkline of df["Close"] with plotext."""
+    try:
+        with _plot_figure(width, height):
+            # Extract data
+            dates = list(range(len(df)))  # Use numeric x-axis for compactness
+            values = df["Close"].tolist()
+            
+            # Plot the line
+            plt.plot(dates, values, marker="braille")
+            
+            # Minimal axes - no labels for sparkline
+            plt.xaxes(False, False)
+            plt.yaxes(False, False)
+            plt.frame(False)
+            
+            # Build and return as string
+            chart_str = plt.build()
         
         return _clean_chart_output(chart_str)
         
@@ -113,6 +278,7 @@ def build_sparkline(
         return f"[Chart error: {str(e)}]"
 
 
+@_ttl_memoize(config.CACHE_EXPIRY_MARKET)
 def build_full_chart(
     ticker: str,
     months: int = 6,
@@ -138,52 +304,54 @@ def build_full_chart(
     if df is None or df.empty:
         return f"[No data available for {ticker}]"
     
+    return _render_once(
+        ("full", ticker, months, width, height, _frame_version(df)),
+        partial(_render_full_chart, df, ticker, months, width, height)
+    )
+
+
+def _render_full_chart(df, ticker: str, months: int, width: int, height: int) -> str:
+    """Draw the detailed chart of df["Close"] with plotext, plus a stats line."""
     try:
-        # Clear any previous plot
-        plt.clf()
-        
-        # Configure plot size and theme
-        plt.plotsize(width, height)
-        plt.theme("dark")
-        
-        # Extract data
-        dates = df.index.tolist()
-        values = df["Close"].tolist()
-        
-        # Create date labels (show first, middle, last)
-        date_labels = []
-        date_positions = []
-        if len(dates) > 0:
-            date_positions.append(0)
-            date_labels.append(dates[0].strftime("%b %d"))
+        with _plot_figure(width, height):
+            # Extract data (kept as arrays; plotext gets a list only at plot time)
+            dates = df.index
+            closes = df["Close"].to_numpy(dtype=float)
             
-            mid = len(dates) // 2
-            date_positions.append(mid)
-            date_labels.append(dates[mid].strftime("%b %d"))
+            # Create date labels (show first, middle, last)
+            date_labels = []
+            date_positions = []
+            if len(dates) > 0:
+                date_positions.append(0)
+                date_labels.append(dates[0].strftime("%b %d"))
+                
+                mid = len(dates) // 2
+                date_positions.append(mid)
+                date_labels.append(dates[mid].strftime("%b %d"))
+                
+                date_positions.append(len(dates) - 1)
+                date_labels.append(dates[-1].strftime("%b %d"))
             
-            date_positions.append(len(dates) - 1)
-            date_labels.append(dates[-1].strftime("%b %d"))
-        
-        # Plot with numeric x values (no legend to keep it clean)
-        x_vals = list(range(len(values)))
-        plt.plot(x_vals, values, marker="braille")
-        
-        # Add title
-        plt.title(f"{get_chart_title(ticker)} - {months}mo")
-        
-        # Configure axes
-        plt.xticks(date_positions, date_labels)
-        
-        # Calculate stats
-        current_val = values[-1]
-        min_val = min(values)
-        max_val = max(values)
-        change = values[-1] - values[0]
-        pct_change = (change / values[0]) * 100 if values[0] != 0 else 0
-        
-        # Build chart string
-        chart_str = plt.build()
-        plt.clf()
+            # Plot with numeric x values (no legend to keep it clean),
+            # thinned to the two braille dots per column plotext can draw
+            x_vals, y_vals = _downsample(closes, width * 2)
+            plt.plot(x_vals.tolist(), y_vals.tolist(), marker="braille")
+            
+            # Add title
+            plt.title(f"{get_chart_title(ticker)} - {months}mo")
+            
+            # Configure axes
+            plt.xticks(date_positions, date_labels)
+            
+            # Calculate stats
+            current_val = closes[-1]
+            min_val = closes.min()
+            max_val = closes.max()
+            change = closes[-1] - closes[0]
+            pct_change = (change / closes[0]) * 100 if closes[0] != 0 else 0
+            
+            # Build chart string
+            chart_str = plt.build()
         
         # Clean up and add summary
         chart_clean = _clean_chart_output(chart_str)
@@ -201,6 +369,7 @@ def build_full_chart(
         return f"[Chart error: {str(e)}]"
 
 
+@_ttl_memoize(config.CACHE_EXPIRY_MARKET)
 def build_comparison_chart(
     tickers: list,
     months: int = 6,
@@ -220,27 +389,36 @@ def build_comparison_chart(
         ASCII chart as a string
     """
     try:
-        plt.clf()
-        plt.plotsize(width, height)
-        plt.theme("dark")
-        
+        # Fetch every series before taking the plot lock
         period = f"{months}mo"
-        
-        for ticker in tickers:
-            df = data_loader.get_historical_data(ticker, period)
-            if df is not None and not df.empty:
-                values = df["Close"].tolist()
-                # Normalize to percentage change from start
-                base = values[0]
-                normalized = [(v / base - 1) * 100 for v in values]
-                x_vals = list(range(len(normalized)))
-                plt.plot(x_vals, normalized, marker="braille", label=get_chart_title(ticker))
-        
-        plt.title(f"Relative Performance - {months}mo")
-        plt.ylabel("% Change")
-        
-        chart_str = plt.build()
-        plt.clf()
+        frames = list(data_loader.get_historical_data_multi(tickers, period).items())
+        versions = tuple(
+            (ticker, _frame_version(df)) for ticker, df in frames if df is not None and not df.empty
+        )
+        return _render_once(
+            ("comparison", months, width, height, versions),
+            partial(_render_comparison_chart, frames, months, width, height)
+        )
+    except Exception as e:
+        return f"[Comparison chart error: {str(e)}]"
+
+
+def _render_comparison_chart(frames: list, months: int, width: int, height: int) -> str:
+    """Draw every (ticker, df) pair normalized to % change from its first bar."""
+    try:
+        with _plot_figure(width, height):
+            for ticker, df in frames:
+                if df is not None and not df.empty:
+                    # Normalize to percentage change from start (one vectorized pass)
+                    closes = df["Close"].to_numpy(dtype=float)
+                    normalized = ((closes / closes[0] - 1.0) * 100.0).tolist()
+                    x_vals = list(range(len(normalized)))
+                    plt.plot(x_vals, normalized, marker="braille", label=get_chart_title(ticker))
+            
+            plt.title(f"Relative Performance - {months}mo")
+            plt.ylabel("% Change")
+            
+            chart_str = plt.build()
         
         return _clean_chart_output(chart_str)
         
@@ -258,6 +436,8 @@ def build_liquidity_chart(
     Returns:
         ASCII chart string + Correlation Verdict.
     """
+    import numpy as np
+    
     try:
         # Fetch data (cached via DuckDB)
         df = data_loader.get_net_liquidity_data()
@@ -265,71 +445,70 @@ def build_liquidity_chart(
         if df is None or df.empty:
             return "[No data for Net Liquidity analysis]"
             
-        # Data is already aligned and filtered
-        dates = df.index.tolist()
-        liquidity = df["Net_Liquidity"].tolist()
-        sp500 = df["SP500"].tolist()
+        # Data is already aligned and filtered (only the date labels need scalars)
+        dates = df.index
+        liquidity = df["Net_Liquidity"].to_numpy(dtype=float)
+        sp500 = df["SP500"].to_numpy(dtype=float)
         
-        # Calculate Correlation (overall)
-        overall_correlation = df["Net_Liquidity"].corr(df["SP500"])
+        # Calculate Correlation (overall); the query already drops NULL rows
+        overall_correlation = float(np.corrcoef(liquidity, sp500)[0, 1])
         
         # Calculate Rolling Correlation (window approx 10% of data points)
         window = max(5, len(df) // 10) 
-        rolling_corr = df["Net_Liquidity"].rolling(window=window).corr(df["SP500"]).fillna(0).tolist()
+        rolling_corr = df["Net_Liquidity"].rolling(window=window).corr(df["SP500"]).fillna(0).to_numpy()
 
         # Verdict
-        if overall_correlation > 0.7:
-            verdict = "[red]HIGH CORRELATION[/red] (Liquidity driving market)"
-        elif overall_correlation > 0.4:
-            verdict = "[yellow]MODERATE CORRELATION[/yellow]"
-        else:
-            verdict = "[green]LOW CORRELATION[/green] (Market decoupled)"
+        verdict = _CORRELATION_VERDICTS[bisect_left(_CORRELATION_LADDER, overall_correlation)]
             
-        # Plotting
-        plt.clf()
-        
-        # Configure subplots (2 rows, 1 column)
-        plt.subplots(2, 1) 
-        
-        # Date labels (start, mid, end)
-        date_labels = []
-        date_positions = []
-        if len(dates) > 0:
-            date_positions.append(0)
-            date_labels.append(dates[0].strftime("%Y-%m"))
-            mid = len(dates) // 2
-            date_positions.append(mid)
-            date_labels.append(dates[mid].strftime("%Y-%m"))
-            date_positions.append(len(dates) - 1)
-            date_labels.append(dates[-1].strftime("%Y-%m"))
+        with _plot_figure():
+            # Plotting
             
-        x_vals = list(range(len(dates)))
-        
-        # Subplot 1: Liquidity vs S&P 500
-        plt.subplot(1, 1)
-        plt.plotsize(width, height) 
-        plt.theme("dark")
-        
-        plt.plot(x_vals, sp500, label="S&P 500", color="blue", marker="braille")
-        plt.plot(x_vals, liquidity, label="Net Liquidity (Billions)", color="orange", marker="braille")
-        plt.ylabel("Value")
-        plt.title(f"Net Liquidity vs S&P 500 (Overall Corr: {overall_correlation:.2f})")
-        plt.xticks(date_positions, date_labels)
-
-        # Subplot 2: Rolling Correlation
-        plt.subplot(2, 1)
-        plt.plotsize(width, height // 2)
-        plt.theme("dark")
-        
-        plt.plot(x_vals, rolling_corr, label=f"Rolling Correlation ({window} periods)", color="magenta", marker="braille")
-        # Add zero line
-        plt.plot(x_vals, [0]*len(x_vals), color="gray", marker="sd")
-        plt.ylim(-1, 1)
-        plt.ylabel("Correlation")
-        plt.xticks(date_positions, date_labels)
-        
-        chart_str = plt.build()
-        plt.clf()
+            # Configure subplots (2 rows, 1 column)
+            plt.subplots(2, 1) 
+            
+            # Date labels (start, mid, end)
+            date_labels = []
+            date_positions = []
+            if len(dates) > 0:
+                date_positions.append(0)
+                date_labels.append(dates[0].strftime("%Y-%m"))
+                mid = len(dates) // 2
+                date_positions.append(mid)
+                date_labels.append(dates[mid].strftime("%Y-%m"))
+                date_positions.append(len(dates) - 1)
+                date_labels.append(dates[-1].strftime("%Y-%m"))
+                
+            # Thin every series to the two braille dots per column plotext can draw
+            target = width * 2
+            x_vals, sp500_pts = _downsample(sp500, target)
+            _, liquidity_pts = _downsample(liquidity, target)
+            _, corr_pts = _downsample(rolling_corr, target)
+            x_vals = x_vals.tolist()
+            
+            # Subplot 1: Liquidity vs S&P 500
+            plt.subplot(1, 1)
+            plt.plotsize(width, height) 
+            plt.theme("dark")
+            
+            plt.plot(x_vals, sp500_pts.tolist(), label="S&P 500", color="blue", marker="braille")
+            plt.plot(x_vals, liquidity_pts.tolist(), label="Net Liquidity (Billions)", color="orange", marker="braille")
+            plt.ylabel("Value")
+            plt.title(f"Net Liquidity vs S&P 500 (Overall Corr: {overall_correlation:.2f})")
+            plt.xticks(date_positions, date_labels)
+
+            # Subplot 2: Rolling Correlation
+            plt.subplot(2, 1)
+            plt.plotsize(width, height // 2)
+            plt.theme("dark")
+            
+            plt.plot(x_vals, corr_pts.tolist(), label=f"Rolling Correlation ({window} periods)", color="magenta", marker="braille")
+            # Add zero line
+            plt.plot(x_vals, [0]*len(x_vals), color="gray", marker="sd")
+            plt.ylim(-1, 1)
+            plt.ylabel("Correlation")
+            plt.xticks(date_positions, date_labels)
+            
+            chart_str = plt.build()
         
         return _clean_chart_output(chart_str) + f"\n\nVERDICT: {verdict}"
         
@@ -351,14 +530,8 @@ def build_yield_curve_chart(
         if not data:
             return f"[No Yield Curve data for {country_code}]"
             
-        # Sort keys based on duration (approximate for sorting)
-        order = ["3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y"]
-        sorted_keys = [k for k in order if k in data]
-        
-        # If we have keys not in standard order, add them at the end
-        for k in data:
-            if k not in sorted_keys:
-                sorted_keys.append(k)
+        # Sort keys based on duration; unknown tenors keep their order at the end
+        sorted_keys = sorted(data, key=_tenor_rank)
                 
         if not sorted_keys:
              return f"[Insufficient Yield Curve data for {country_code}]"
@@ -366,30 +539,26 @@ def build_yield_curve_chart(
         x_labels = sorted_keys
         y_values = [data[k] for k in sorted_keys]
         
-        plt.clf()
-        plt.plotsize(width, height)
-        plt.theme("dark")
-        
-        # We use indices for x-axis to keep spacing even
-        x_indices = list(range(len(x_labels)))
-        
-        plt.plot(x_indices, y_values, marker="braille", color="green", label="Yield")
-        
-        # Add 'dots' (using scatter on same points)
-        plt.scatter(x_indices, y_values, marker="dot", color="white")
+        with _plot_figure(width, height):
+            # We use indices for x-axis to keep spacing even
+            x_indices = list(range(len(x_labels)))
+            
+            plt.plot(x_indices, y_values, marker="braille", color="green", label="Yield")
+            
+            # Add 'dots' (using scatter on same points)
+            plt.scatter(x_indices, y_values, marker="dot", color="white")
 
-        plt.title(f"{country_code} Yield Curve")
-        plt.ylabel("Yield (%)")
-        plt.xticks(x_indices, x_labels)
-        
-        # Check for inversion (10Y < 3M) if available
-        if "10Y" in data and "3M" in data:
-            spread = data["10Y"] - data["3M"]
-            if spread < 0:
-                plt.title(f"{country_code} Yield Curve (INVERTED: {spread:.2f}%)")
-        
-        chart_str = plt.build()
-        plt.clf()
+            plt.title(f"{country_code} Yield Curve")
+            plt.ylabel("Yield (%)")
+            plt.xticks(x_indices, x_labels)
+            
+            # Check for inversion (10Y < 3M) if available
+            if "10Y" in data and "3M" in data:
+                spread = data["10Y"] - data["3M"]
+                if spread < 0:
+                    plt.title(f"{country_code} Yield Curve (INVERTED: {spread:.2f}%)")
+            
+            chart_str = plt.build()
         
         return _clean_chart_output(chart_str)
         
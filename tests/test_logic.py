@@ -0,0 +1,102 @@
+"""
+Project Sentinel - Logic Engine tests
+
+Run with: python -m unittest discover tests
+"""
+
+import importlib.util
+import math
+import unittest
+
+from modules import logic
+
+# Vectorized helpers need numpy (imported lazily by logic)
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class InterestRatioStatusTest(unittest.TestCase):
+    def test_ladder(self):
+        self.assertEqual(logic.get_interest_ratio_status(0.10), "SAFE")
+        self.assertEqual(logic.get_interest_ratio_status(0.15), "WARNING")
+        self.assertEqual(logic.get_interest_ratio_status(0.20), "CRITICAL")
+
+    def test_nan_is_safe(self):
+        self.assertEqual(logic.get_interest_ratio_status(float("nan")), "SAFE")
+
+
+class DebtGdpStatusTest(unittest.TestCase):
+    def test_developed_ladder(self):
+        self.assertEqual(logic.get_debt_gdp_status(90.0), "SAFE")
+        self.assertEqual(logic.get_debt_gdp_status(100.0), "WARNING")
+        self.assertEqual(logic.get_debt_gdp_status(120.0), "CRITICAL")
+
+    def test_emerging_ladder(self):
+        self.assertEqual(logic.get_debt_gdp_status(60.0, is_emerging_market=True), "SAFE")
+        self.assertEqual(logic.get_debt_gdp_status(70.0, is_emerging_market=True), "WARNING")
+        self.assertEqual(logic.get_debt_gdp_status(90.0, is_emerging_market=True), "CRITICAL")
+
+    def test_nan_is_safe(self):
+        self.assertEqual(logic.get_debt_gdp_status(float("nan")), "SAFE")
+        self.assertEqual(logic.get_debt_gdp_status(float("nan"), is_emerging_market=True), "SAFE")
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class VectorizedRatiosTest(unittest.TestCase):
+    def test_zero_denominator_is_inf(self):
+        ratios = logic.calculate_interest_revenue_ratio_vec([1.0, 2.0], [4.0, 0.0])
+        self.assertEqual(ratios.tolist(), [0.25, math.inf])
+        self.assertEqual(logic.calculate_debt_to_gdp_ratio_vec([50.0], [0.0]).tolist(), [math.inf])
+
+    def test_nan_passes_through(self):
+        ratios = logic.calculate_debt_to_gdp_ratio_vec([float("nan"), 120.0], [100.0, 100.0])
+        self.assertTrue(math.isnan(ratios[0]))
+        self.assertAlmostEqual(ratios[1], 120.0)
+
+    def test_broadcasting(self):
+        ratios = logic.calculate_interest_revenue_ratio_vec([[1.0], [2.0]], [2.0, 4.0])
+        self.assertEqual(ratios.tolist(), [[0.5, 0.25], [1.0, 0.5]])
+
+    def test_matches_scalar(self):
+        for interest, revenue in ((18.0, 100.0), (5.0, 0.0)):
+            self.assertEqual(
+                logic.calculate_interest_revenue_ratio_vec([interest], [revenue])[0],
+                logic.calculate_interest_revenue_ratio(interest, revenue)
+            )
+
+    def test_days_of_interest_missing_is_zero(self):
+        days = logic.calculate_days_of_interest_vec([365.0, float("nan")], [100.0, 5.0])
+        self.assertEqual(days.tolist(), [1.0, 0.0])
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class VectorizedStatusTest(unittest.TestCase):
+    def test_interest_ratio_matches_scalar(self):
+        ratios = [0.10, 0.15, 0.20, float("nan")]
+        self.assertEqual(
+            logic.get_interest_ratio_status_vec(ratios).tolist(),
+            [logic.get_interest_ratio_status(r) for r in ratios]
+        )
+
+    def test_nan_is_safe(self):
+        self.assertEqual(
+            logic.get_interest_ratio_status_vec([0.1, float("nan"), 0.3]).tolist(),
+            ["SAFE", "SAFE", "CRITICAL"]
+        )
+
+    def test_debt_gdp_matches_scalar(self):
+        ratios = [60.0, 70.0, 90.0, 100.0, 120.0, float("nan")]
+        for emerging in (False, True):
+            self.assertEqual(
+                logic.get_debt_gdp_status_vec(ratios, is_emerging_market=emerging).tolist(),
+                [logic.get_debt_gdp_status(r, is_emerging_market=emerging) for r in ratios]
+            )
+
+    def test_sign_and_threshold_checkers(self):
+        self.assertEqual(logic.get_growth_spread_status_vec([-1.0, 1.0]).tolist(), ["SAFE", "CRITICAL"])
+        self.assertEqual(logic.get_yield_curve_status_vec([-0.5, 0.5]).tolist(), ["CRITICAL", "SAFE"])
+        self.assertEqual(logic.get_bond_vigilante_status_vec([0.0, 100.0]).tolist(), [False, True])
+        self.assertEqual(logic.get_currency_risk_status_vec([0.0, 1000.0]).tolist(), [False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
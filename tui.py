@@ -5,14 +5,21 @@ Project Sentinel - Interactive TUI
 A Textual-based terminal dashboard for monitoring Sovereign Debt & Fiscal Dominance.
 """
 
+import re
 import time
 import feedparser
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, Grid
 from textual.widgets import Header, Footer, Static, Label, TabbedContent, TabPane, DataTable, Button
+from textual.coordinate import Coordinate
 from textual.reactive import reactive
 from textual.worker import Worker, get_current_worker
 
@@ -24,6 +31,120 @@ from rich import box
 from modules import data_loader, logic, render_chart
 import config
 
+# Shared keep-alive session so each refresh reuses pooled connections to the feed hosts
+_RSS_SESSION = requests.Session()
+_RSS_SESSION.headers["User-Agent"] = feedparser.USER_AGENT
+_RSS_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_RSS_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+# Headline filter: any keyword, case-insensitive substring (one regex pass per title)
+_NEWS_KEYWORDS = ("Treasury", "Fed", "Auction", "Yield", "Bond", "Debt", "Inflation", "Gold")
+_NEWS_KEYWORDS_RE = re.compile("|".join(map(re.escape, _NEWS_KEYWORDS)), re.IGNORECASE)
+
+# Last fetch per feed URL: (ETag, Last-Modified, body bytes, headlines)
+_FEED_CACHE: Dict[str, tuple] = {}
+
+# Minimum spacing between Net Liquidity chart rebuilds
+_LIQUIDITY_MIN_RELOAD_SECONDS = 30
+
+# "<flag> <code>" labels built once from config (tab titles, grid rows)
+_COUNTRY_LABELS = {
+    code: f"{country['flag']} {code}" for code, country in config.COUNTRIES.items()
+}
+
+# Alert status -> color, and the colored percentage cell built from it
+# (precompiled format dispatch)
+_STATUS_COLOR = {"SAFE": "green", "WARNING": "yellow", "CRITICAL": "red"}
+_STATUS_FMT = {
+    status: f"[{color}]{{:.1f}}%[/{color}]" for status, color in _STATUS_COLOR.items()
+}
+
+
+def _is_displayed(widget) -> bool:
+    """True when the widget and every ancestor are displayed (i.e. its tab is active)."""
+    return all(node.display for node in widget.ancestors_with_self)
+
+
+def _sync_rows(table: DataTable, previous: Optional[List[tuple]], rows: List[tuple]) -> List[tuple]:
+    """
+    Bring a DataTable from `previous` (the rows last synced, or None) to `rows`,
+    touching only the cells that changed. Returns `rows` for the caller to keep.
+    
+    The table is rebuilt only when its shape changes; otherwise differing
+    cells are updated in place and an unchanged table is left alone.
+    """
+    if previous is not None and len(previous) == len(rows) and all(
+        len(old) == len(new) for old, new in zip(previous, rows)
+    ):
+        for r, (old, new) in enumerate(zip(previous, rows)):
+            for c, (old_cell, new_cell) in enumerate(zip(old, new)):
+                if old_cell != new_cell:
+                    table.update_cell_at(Coordinate(r, c), new_cell)
+    else:
+        table.clear()
+        table.add_rows(rows)
+    return rows
+
+
+def _feed_headlines(feed) -> List[str]:
+    """Keyword-matching "[source] title" lines from a parsed feed's top entries."""
+    items = []
+    try:
+        for entry in feed.entries[:5]: # Top 5 per feed
+            title = entry.title
+            # Simple keyword filter
+            if _NEWS_KEYWORDS_RE.search(title):
+                source = feed.feed.get('title', 'News')
+                items.append(f"[{source}] {title}")
+    except Exception:
+        pass
+    return items
+
+
+def _fetch_headlines(url: str) -> Optional[List[str]]:
+    """
+    Download one RSS feed and return its headlines, or None if it is unreachable
+    or answers with an HTTP error (the cached entry is left untouched).
+    
+    Sends the previous ETag/Last-Modified so an unchanged feed comes back as
+    304; that, or a byte-identical body from a server without validators,
+    reuses the last headlines without parsing or filtering again.
+    """
+    cached = _FEED_CACHE.get(url)
+    headers = {}
+    if cached:
+        etag, modified, _, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+    try:
+        response = _RSS_SESSION.get(url, timeout=10, headers=headers)
+        # An error page must not be parsed and cached over the last good headlines
+        response.raise_for_status()
+        if cached and (response.status_code == 304 or response.content == cached[2]):
+            return cached[3]
+        items = _feed_headlines(feedparser.parse(response.content))
+        _FEED_CACHE[url] = (
+            response.headers.get("ETag"), response.headers.get("Last-Modified"), response.content, items
+        )
+        return items
+    except Exception:
+        return None
+
+
+def _derive_ratios(data: data_loader.CountryMetrics) -> Dict[str, Optional[float]]:
+    """Ratios shown in several places (tables, alerts, grid), computed once per snapshot."""
+    return {
+        "debt_gdp": (
+            logic.calculate_debt_to_gdp_ratio(data.total_debt, data.gdp)
+            if data.total_debt and data.gdp else None
+        ),
+        "int_rev": (
+            logic.calculate_interest_revenue_ratio(data.interest_payments, data.tax_receipts)
+            if data.interest_payments and data.tax_receipts else None
+        ),
+    }
+
 # =============================================================================
 # Custom Widgets
 # =============================================================================
@@ -32,50 +153,61 @@ class NewsTicker(Static):
     """Scrolling news ticker fetching from RSS."""
     
     NEWS_ITEMS = reactive([])
-    current_index = reactive(0)
+    current_index = 0  # Next item to show (plain attribute: advancing it needs no repaint)
+    _displayed = None  # Last text pushed to the widget
+    _news_worker = None  # Worker of the current/last RSS pass
     
     def on_mount(self) -> None:
         """Start background fetch and scroll."""
         self.update_news()
-        self.set_interval(600, self.update_news) # Fetch every 10 mins
+        self._news_timer = self.set_interval(600, self.update_news) # Fetch every 10 mins
         self.set_interval(4.0, self.scroll_ticker) 
         
+    def on_hide(self) -> None:
+        """Stop polling feeds while the ticker is off screen."""
+        self._news_timer.pause()
+        
+    def on_show(self) -> None:
+        self._news_timer.resume()
+        
     def update_news(self) -> None:
-        """Fetch RSS feeds in background."""
-        self.run_worker(self._fetch_rss, thread=True)
+        """Fetch RSS feeds in background (at most one pass in flight)."""
+        # A slow feed can outlast the interval: let the running pass finish
+        if self._news_worker is not None and not self._news_worker.is_finished:
+            return
+        self._news_worker = self.run_worker(self._fetch_rss, thread=True)
         
     def _fetch_rss(self):
-        items = []
-        keywords = ["Treasury", "Fed", "Auction", "Yield", "Bond", "Debt", "Inflation", "Gold"]
-        
-        for url in config.RSS_FEEDS:
-            try:
-                feed = feedparser.parse(url)
-                for entry in feed.entries[:5]: # Top 5 per feed
-                    title = entry.title
-                    # Simple keyword filter
-                    if any(k.lower() in title.lower() for k in keywords):
-                        source = feed.feed.get('title', 'News')
-                        items.append(f"[{source}] {title}")
-            except Exception:
-                pass
+        # Feeds are independent I/O-bound requests: fetch them side by side
+        with ThreadPoolExecutor(max_workers=len(config.RSS_FEEDS)) as executor:
+            per_feed = list(executor.map(_fetch_headlines, config.RSS_FEEDS))
+        items = [item for headlines in per_feed if headlines for item in headlines]
         
         if items:
-            self.NEWS_ITEMS = items
+            # Reactive assignment must happen on the UI thread
+            self.app.call_from_thread(setattr, self, "NEWS_ITEMS", items)
 
     def scroll_ticker(self) -> None:
         """Update the displayed text."""
+        # Nothing to draw while the ticker is hidden or has no width
+        if not _is_displayed(self) or not self.region.width:
+            return
         if not self.NEWS_ITEMS:
-            self.update("Fetching market news...")
+            self._show("Fetching market news...")
             return
             
-        # Create a rolling string
-        text = "  ***  ".join(self.NEWS_ITEMS) + "  ***  "
-        # Display a window of it? 
-        # For simple ticker, just cycle through items
-        item = self.NEWS_ITEMS[self.current_index % len(self.NEWS_ITEMS)]
-        self.update(f"📰 {item}")
-        self.current_index += 1
+        # Cycle through items one at a time
+        count = len(self.NEWS_ITEMS)
+        item = self.NEWS_ITEMS[self.current_index % count]
+        self._show(f"📰 {item}")
+        # Wrap so the index stays within the list
+        self.current_index = (self.current_index + 1) % count
+
+    def _show(self, text: str) -> None:
+        """Push text to the widget only when it differs from what is displayed."""
+        if text != self._displayed:
+            self._displayed = text
+            self.update(text)
 
 
 class MetricPanel(Static):
@@ -88,9 +220,7 @@ class MetricPanel(Static):
         self.status = status
         
     def render(self) -> Panel:
-        color = "green"
-        if self.status == "WARNING": color = "yellow"
-        elif self.status == "CRITICAL": color = "red"
+        color = _STATUS_COLOR.get(self.status, "green")
         
         return Panel(
             f"[{color}]{self.value_text}[/{color}]\n[dim]{self.status}[/dim]",
@@ -106,7 +236,14 @@ class FiscalDashboard(Container):
     def __init__(self, country_code: str, **kwargs):
         super().__init__(**kwargs)
         self.country_code = country_code
-        self.metrics_data = {}
+        self.metrics_data = None
+        self.day_zero = None
+        self._panel_content = {}  # widget id -> last rendered chart string
+        self._synced_rows: Dict[str, List[tuple]] = {}  # "fiscal" / "monetary" -> rows last shown
+        self._stale = False  # A scheduled refresh was skipped while hidden
+        # Per-country config resolved once instead of on every refresh
+        self._debt_spiral_threshold = config.COUNTRY_CONFIGS[country_code].thresholds.interest_rev_critical
+        self._yield_ticker = config.METRIC_INDEX.get((country_code, "yield_10y"))
         
     def compose(self) -> ComposeResult:
         yield Label(f"Loading {self.country_code} Data...", id=f"loading-{self.country_code}")
@@ -126,144 +263,242 @@ class FiscalDashboard(Container):
             yield Static(id=f"alerts-{self.country_code}", classes="alert-bar")
 
     def on_mount(self) -> None:
+        # Widgets are composed once: resolve them here instead of per refresh
+        code = self.country_code
+        self._loading = self.query_one(f"#loading-{code}")
+        self._content = self.query_one(f"#content-{code}")
+        self._fiscal_table = self.query_one(f"#fiscal-stats-{code}", DataTable)
+        self._monetary_table = self.query_one(f"#monetary-stats-{code}", DataTable)
+        self._alerts = self.query_one(f"#alerts-{code}")
+        self._chart_widgets = {
+            widget_id: self.query_one(f"#{widget_id}") for widget_id in (f"chart-yield-{code}", f"chart-gold-{code}")
+        }
+        
+        # Table chrome is static: configure it once rather than on every refresh
+        for table in (self._fiscal_table, self._monetary_table):
+            table.cursor_type = "row"
+            table.add_columns("Metric", "Value")
+            
         self.load_data()
-        self.set_interval(60, self.load_data)
+        self.set_interval(60, self._scheduled_refresh)
+
+    def _scheduled_refresh(self) -> None:
+        # Hidden tabs skip the poll and catch up when they are shown again
+        if _is_displayed(self):
+            self.load_data()
+        else:
+            self._stale = True
+
+    def refresh_if_stale(self) -> None:
+        if self._stale and _is_displayed(self):
+            self.load_data()
 
     def load_data(self) -> None:
+        self._stale = False
         self.run_worker(self._fetch_data, thread=True)
 
     def _fetch_data(self):
-        data = data_loader.get_country_metrics(self.country_code)
-        self.update_ui(data)
-
-    def update_ui(self, data: dict) -> None:
-        self.query_one(f"#loading-{self.country_code}").display = False
-        self.query_one(f"#content-{self.country_code}").display = True
-        self.query_one(f"#content-{self.country_code}").remove_class("hidden")
-        
-        # 1. Update Fiscal Stats
-        fiscal_table = self.query_one(f"#fiscal-stats-{self.country_code}", DataTable)
-        fiscal_table.cursor_type = "row"
-        fiscal_table.clear()
-        if not fiscal_table.columns:
-            fiscal_table.add_columns("Metric", "Value")
-        
-        self._populate_fiscal_table(fiscal_table, data)
-        
-        # 2. Update Monetary Stats
-        mon_table = self.query_one(f"#monetary-stats-{self.country_code}", DataTable)
-        mon_table.cursor_type = "row"
-        mon_table.clear()
-        if not mon_table.columns:
-            mon_table.add_columns("Metric", "Value")
-            
-        self._populate_monetary_table(mon_table, data)
+        # All network/DB/plotext work happens here, off the UI thread. The
+        # metrics, charts and forecast are independent, so fetch them together.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            data_future = executor.submit(data_loader.get_country_metrics, self.country_code)
+            charts_future = executor.submit(self._build_charts)
+            day_zero_future = (
+                executor.submit(logic.predict_doom_loop_day_zero) if self.country_code == "US" else None
+            )
+            data = data_future.result()
+            charts = charts_future.result()
+            day_zero = day_zero_future.result() if day_zero_future else None
         
-        # 3. Charts (Ascii)
-        # Yield Curve
-        yield_chart = render_chart.build_yield_curve_chart(self.country_code, width=50, height=10)
-        self.query_one(f"#chart-yield-{self.country_code}").update(
-            Panel(Text.from_ansi(yield_chart), title="Yield Curve", border_style="white")
-        )
+        # Hand the finished results to the UI thread
+        self.app.call_from_thread(self.update_ui, data, charts, day_zero)
+
+    def _build_charts(self) -> List[tuple]:
+        """
+        Render this dashboard's charts as (widget_id, chart, panel).
+        
+        The Rich Panel (ANSI parsing included) is built here on the worker;
+        it is None when the chart matches what the widget already shows.
+        """
+        # Each chart fetches its own data before taking the plot lock, so
+        # building them side by side overlaps those network/DB reads
+        specs = [
+            # Yield Curve
+            (f"chart-yield-{self.country_code}", "Yield Curve", "white",
+             partial(render_chart.build_yield_curve_chart, self.country_code, width=50, height=10)),
+        ]
         
         # Gold/Bond Ratio (If US) or just Yield History
         if self.country_code == "US":
             # Comparison Chart: Gold vs 10Y Yield
-            gold_bond_chart = render_chart.build_comparison_chart(["GC=F", "^TNX"], width=50, height=10)
-            self.query_one(f"#chart-gold-{self.country_code}").update(
-                Panel(Text.from_ansi(gold_bond_chart), title="Gold vs Yields (Deflation/Confidence)", border_style="yellow")
-            )
+            specs.append((
+                f"chart-gold-{self.country_code}", "Gold vs Yields (Deflation/Confidence)", "yellow",
+                partial(render_chart.build_comparison_chart, ["GC=F", "^TNX"], width=50, height=10)
+            ))
         else:
              # Just Yield History
-            ticker = config.COUNTRIES[self.country_code]["metrics"].get("yield_10y")
+            ticker = self._yield_ticker
             if ticker:
-                hist_chart = render_chart.build_full_chart(ticker, width=50, height=10)
-                self.query_one(f"#chart-gold-{self.country_code}").update(
-                    Panel(Text.from_ansi(hist_chart), title="10Y Yield History", border_style="yellow")
-                )
+                specs.append((
+                    f"chart-gold-{self.country_code}", "10Y Yield History", "yellow",
+                    partial(render_chart.build_full_chart, ticker, width=50, height=10)
+                ))
+        
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            futures = [
+                (widget_id, executor.submit(build), title, border_style)
+                for widget_id, title, border_style, build in specs
+            ]
+            charts = [
+                (widget_id, future.result(), title, border_style)
+                for widget_id, future, title, border_style in futures
+            ]
+        
+        return [
+            (
+                widget_id, chart,
+                None if self._panel_content.get(widget_id) == chart
+                else Panel(Text.from_ansi(chart), title=title, border_style=border_style)
+            )
+            for widget_id, chart, title, border_style in charts
+        ]
+
+    def update_ui(
+        self,
+        data: data_loader.CountryMetrics,
+        charts: List[tuple],
+        day_zero: Optional[tuple] = None
+    ) -> None:
+        self._loading.display = False
+        self._content.display = True
+        self._content.remove_class("hidden")
+        
+        # Metric panels only change when the fetched values do
+        # (last_updated is just the fetch stamp, so it is ignored)
+        metrics_dirty = (
+            self.metrics_data is None
+            or replace(data, last_updated="") != replace(self.metrics_data, last_updated="")
+            or day_zero != self.day_zero
+        )
+        self.metrics_data = data
+        self.day_zero = day_zero
+        
+        if metrics_dirty:
+            ratios = _derive_ratios(data)
+            
+            # 1. Update Fiscal Stats
+            self._synced_rows["fiscal"] = _sync_rows(
+                self._fiscal_table,
+                self._synced_rows.get("fiscal"),
+                self._populate_fiscal_table(data, ratios, day_zero)
+            )
+            
+            # 2. Update Monetary Stats
+            self._synced_rows["monetary"] = _sync_rows(
+                self._monetary_table,
+                self._synced_rows.get("monetary"),
+                self._populate_monetary_table(data)
+            )
+            
+            # 3. Alerts
+            self._update_alerts(ratios)
+        
+        # 4. Charts (Ascii)
+        for widget_id, chart, panel in charts:
+            self._update_chart_panel(widget_id, chart, panel)
 
-        # 4. Alerts
-        self._update_alerts(data)
+    def _update_chart_panel(self, widget_id: str, chart: str, panel: Optional[Panel]) -> None:
+        """Swap in a prebuilt chart panel only if its chart output changed."""
+        if panel is None or self._panel_content.get(widget_id) == chart:
+            return
+        self._panel_content[widget_id] = chart
+        self._chart_widgets[widget_id].update(panel)
 
-    def _populate_fiscal_table(self, table: DataTable, data: dict) -> None:
-        currency = data.get("currency_symbol", "")
+    def _populate_fiscal_table(
+        self,
+        data: data_loader.CountryMetrics,
+        ratios: Dict[str, Optional[float]],
+        day_zero: Optional[tuple] = None
+    ) -> List[tuple]:
+        rows = []
+        currency = data.currency_symbol
         
         # Debt
-        debt = data.get("total_debt")
-        table.add_row("Total Debt", f"{debt:,.0f} B {currency}" if debt else "N/A")
+        debt = data.total_debt
+        rows.append(("Total Debt", f"{debt:,.0f} B {currency}" if debt else "N/A"))
         
         # Debt/GDP
-        if data.get("total_debt") and data.get("gdp"):
-            ratio = logic.calculate_debt_to_gdp_ratio(data["total_debt"], data["gdp"])
+        ratio = ratios["debt_gdp"]
+        if ratio is not None:
             status = logic.get_debt_gdp_status(ratio)
-            # Rich formatting in DataTable requires Text objects or string markup
-            # Textual DataTable supports rich text
-            color = "red" if status == "CRITICAL" else "yellow" if status == "WARNING" else "green"
-            table.add_row("Debt/GDP", f"[{color}]{ratio:.1f}%[/{color}]")
+            # Textual DataTable supports rich text markup
+            rows.append(("Debt/GDP", _STATUS_FMT[status].format(ratio)))
         
         # Interest/Revenue
-        if data.get("interest_payments") and data.get("tax_receipts"):
-            ratio = logic.calculate_interest_revenue_ratio(data["interest_payments"], data["tax_receipts"])
+        ratio = ratios["int_rev"]
+        if ratio is not None:
             status = logic.get_interest_ratio_status(ratio)
-            color = "red" if status == "CRITICAL" else "yellow" if status == "WARNING" else "green"
-            table.add_row("Interest/Revenue", f"[{color}]{ratio*100:.1f}%[/{color}]")
+            rows.append(("Interest/Revenue", _STATUS_FMT[status].format(ratio * 100)))
             
         # Days of Interest
-        yield_10y = data.get("yield_10y")
+        yield_10y = data.yield_10y
         if debt and yield_10y:
             daily_cost = logic.calculate_days_of_interest(debt, yield_10y)
-            table.add_row("Daily Interest Cost", f"[bold red]{daily_cost:,.2f} B {currency}[/bold red]")
+            rows.append(("Daily Interest Cost", f"[bold red]{daily_cost:,.2f} B {currency}[/bold red]"))
 
-        # Doom Loop Forecast (US Only)
-        if self.country_code == "US":
-            years, date_str = logic.predict_doom_loop_day_zero()
+        # Doom Loop Forecast (US Only, computed by the fetch worker)
+        if day_zero is not None:
+            years, date_str = day_zero
             if years is not None:
                 color = "red" if years < 10 else "yellow"
-                table.add_row("Doom Loop Day Zero", f"[{color}]{years:.1f} Yrs ({date_str})[/{color}]")
+                rows.append(("Doom Loop Day Zero", f"[{color}]{years:.1f} Yrs ({date_str})[/{color}]"))
+        return rows
 
-    def _populate_monetary_table(self, table: DataTable, data: dict) -> None:
+    def _populate_monetary_table(self, data: data_loader.CountryMetrics) -> List[tuple]:
+        rows = []
         # Yields
-        y10 = data.get("yield_10y")
-        table.add_row("10Y Yield", f"{y10:.2f}%" if y10 else "N/A")
+        y10 = data.yield_10y
+        rows.append(("10Y Yield", f"{y10:.2f}%" if y10 else "N/A"))
         
         # Inflation
-        inf = data.get("inflation_yoy")
-        table.add_row("Inflation (YoY)", f"{inf:.2f}%" if inf else "N/A")
+        inf = data.inflation_yoy
+        rows.append(("Inflation (YoY)", f"{inf:.2f}%" if inf else "N/A"))
         
         # Real Yield
         if y10 and inf:
             real = logic.calculate_real_yield(y10, inf)
             color = "green" if real > 0 else "red"
-            table.add_row("Real Yield (CPI)", f"[{color}]{real:+.2f}%[/{color}]")
+            rows.append(("Real Yield (CPI)", f"[{color}]{real:+.2f}%[/{color}]"))
 
         # Breakeven / Market Real Yield
-        breakeven = data.get("breakeven_5y")
+        breakeven = data.breakeven_5y
         if y10 is not None and breakeven is not None:
             market_real_yield = logic.calculate_market_real_yield(y10, breakeven)
             color = "green" if market_real_yield > 0 else "red"
-            table.add_row("Market Real Yield", f"[{color}]{market_real_yield:+.2f}%[/{color}]")
-            table.add_row("Inflation Exp (5Y)", f"{breakeven:.2f}%")
+            rows.append(("Market Real Yield", f"[{color}]{market_real_yield:+.2f}%[/{color}]"))
+            rows.append(("Inflation Exp (5Y)", f"{breakeven:.2f}%"))
         
         # Term Premium
-        tp = data.get("term_premium_10y")
+        tp = data.term_premium_10y
         if y10 is not None and tp is not None:
             fed_exp = logic.calculate_fed_rate_expectation(y10, tp)
-            table.add_row("Term Premium (Risk)", f"{tp:.2f}%")
-            table.add_row("Implied Fed Rate", f"{fed_exp:.2f}%")
+            rows.append(("Term Premium (Risk)", f"{tp:.2f}%"))
+            rows.append(("Implied Fed Rate", f"{fed_exp:.2f}%"))
             
         # Currency
-        if "usd_zar" in data and data["usd_zar"]:
-             table.add_row("USD/ZAR", f"{data['usd_zar']:.2f}")
+        if data.usd_zar:
+             rows.append(("USD/ZAR", f"{data.usd_zar:.2f}"))
+        return rows
         
-    def _update_alerts(self, data: dict) -> None:
+    def _update_alerts(self, ratios: Dict[str, Optional[float]]) -> None:
         alerts = []
         # Check Debt Spiral
-        if data.get("interest_payments") and data.get("tax_receipts"):
-            ratio = logic.calculate_interest_revenue_ratio(data["interest_payments"], data["tax_receipts"])
-            if ratio > 0.20:
+        ratio = ratios["int_rev"]
+        if ratio is not None:
+            if ratio > self._debt_spiral_threshold:
                 alerts.append("CRITICAL: DEBT SPIRAL DETECTED (Int/Rev > 20%)")
         
-        alert_widget = self.query_one(f"#alerts-{self.country_code}")
+        alert_widget = self._alerts
         if alerts:
             alert_widget.update(" | ".join(alerts))
             alert_widget.add_class("critical")
@@ -276,52 +511,65 @@ class GlobalGrid(Container):
     """
     Multi-country comparison table.
     """
+    COUNTRIES = ("US", "SA", "JP", "UK", "DE")  # Grid rows, in display order
+    _stale = False  # A scheduled refresh was skipped while hidden
+    _rows = None  # Rows last shown in the table
     
     def compose(self) -> ComposeResult:
         yield Label("Global Sovereign Debt Monitor", classes="header-label")
         yield DataTable()
 
     def on_mount(self) -> None:
-        table = self.query_one(DataTable)
+        table = self._table = self.query_one(DataTable)
         table.add_columns("Country", "10Y Yield", "Debt/GDP", "Int/Revenue", "Status")
         self.load_data()
-        self.set_interval(60, self.load_data)
+        self.set_interval(60, self._scheduled_refresh)
+
+    def _scheduled_refresh(self) -> None:
+        # Hidden tabs skip the poll and catch up when they are shown again
+        if _is_displayed(self):
+            self.load_data()
+        else:
+            self._stale = True
+
+    def refresh_if_stale(self) -> None:
+        if self._stale and _is_displayed(self):
+            self.load_data()
         
     def load_data(self) -> None:
+        self._stale = False
         self.run_worker(self._fetch_all, thread=True)
         
     def _fetch_all(self):
         rows = []
-        for code in ["US", "SA", "JP", "UK", "DE"]:
-            data = data_loader.get_country_metrics(code)
+        # Fetch every country concurrently rather than one after another
+        for code, data in data_loader.get_countries_metrics(self.COUNTRIES).items():
             
             # Yield
-            y10 = f"{data.get('yield_10y', 0):.2f}%" if data.get('yield_10y') else "N/A"
+            y10 = f"{data.yield_10y:.2f}%" if data.yield_10y else "N/A"
+            
+            ratios = _derive_ratios(data)
             
             # Debt/GDP
             dg = "N/A"
-            if data.get("total_debt") and data.get("gdp"):
-                ratio = logic.calculate_debt_to_gdp_ratio(data["total_debt"], data["gdp"])
-                dg = f"{ratio:.1f}%"
+            if ratios["debt_gdp"] is not None:
+                dg = f"{ratios['debt_gdp']:.1f}%"
                 
             # Int/Rev
             ir = "N/A"
-            if data.get("interest_payments") and data.get("tax_receipts"):
-                ratio = logic.calculate_interest_revenue_ratio(data["interest_payments"], data["tax_receipts"])
-                ir = f"{ratio*100:.1f}%"
+            if ratios["int_rev"] is not None:
+                ir = f"{ratios['int_rev']*100:.1f}%"
                 
             # Status
             status = "STABLE" # Simple logic for now
-            if data.get("yield_10y", 0) > 10: status = "CRITICAL"
+            if (data.yield_10y or 0) > 10: status = "CRITICAL"
             
-            rows.append((config.COUNTRIES[code]["flag"] + " " + code, y10, dg, ir, status))
+            rows.append((_COUNTRY_LABELS[code], y10, dg, ir, status))
             
-        self.update_table(rows)
+        self.app.call_from_thread(self.update_table, rows)
 
     def update_table(self, rows: List[tuple]):
-        table = self.query_one(DataTable)
-        table.clear()
-        table.add_rows(rows)
+        self._rows = _sync_rows(self._table, self._rows, rows)
 
 
 class LiquidityPanel(Container):
@@ -332,16 +580,53 @@ class LiquidityPanel(Container):
         yield Label("Global Net Liquidity vs S&P 500", classes="header-label")
         yield Static(id="liquidity-chart", classes="chart-panel")
         
+    _stale = True  # Not rendered yet, or a refresh was requested while hidden
+    _last_load = float("-inf")  # time.monotonic() of the last chart build
+    _chart_content = None  # Last chart string shown
+    _reload_timer = None  # Deferred reload for a refresh that hit the rate limit
+    
     def on_mount(self) -> None:
-        self.load_chart()
+        self._chart = self.query_one("#liquidity-chart")
+        # Build the chart once its tab is first shown, not at startup
+        self.call_after_refresh(self.refresh_if_stale)
+        
+    def refresh_if_stale(self) -> None:
+        if self._stale and _is_displayed(self):
+            self.load_chart()
+            
+    def request_refresh(self) -> None:
+        """Reload now if visible, otherwise when the tab is next shown."""
+        if _is_displayed(self):
+            self.load_chart()
+        else:
+            self._stale = True
         
     def load_chart(self):
+        # The chart is slow to build and its inputs move slowly: rate-limit
+        # rebuilds, deferring (not dropping) one that arrives too soon
+        now = time.monotonic()
+        remaining = self._last_load + _LIQUIDITY_MIN_RELOAD_SECONDS - now
+        if remaining > 0:
+            self._stale = True
+            if self._reload_timer is None:
+                self._reload_timer = self.set_timer(remaining, self._deferred_reload)
+            return
+        self._stale = False
+        self._last_load = now
         self.run_worker(self._update_chart, thread=True)
         
+    def _deferred_reload(self) -> None:
+        self._reload_timer = None
+        self.refresh_if_stale()
+        
     def _update_chart(self):
         # This can be slow, so run in worker
         chart_str = render_chart.build_liquidity_chart(width=100, height=20)
-        self.query_one("#liquidity-chart").update(Text.from_ansi(chart_str))
+        # Identical output (e.g. markets closed): skip the ANSI parse and repaint
+        if chart_str == self._chart_content:
+            return
+        self._chart_content = chart_str
+        self.app.call_from_thread(self._chart.update, Text.from_ansi(chart_str))
 
 
 class SentinelApp(App):
@@ -423,10 +708,10 @@ class SentinelApp(App):
         yield Header(show_clock=True)
         
         with TabbedContent():
-            with TabPane("🇺🇸 US", id="tab-us"):
+            with TabPane(_COUNTRY_LABELS["US"], id="tab-us"):
                 yield FiscalDashboard("US")
                 
-            with TabPane("🇿🇦 SA", id="tab-sa"):
+            with TabPane(_COUNTRY_LABELS["SA"], id="tab-sa"):
                 yield FiscalDashboard("SA")
                 
             with TabPane("🌍 Global", id="tab-global"):
@@ -437,6 +722,13 @@ class SentinelApp(App):
                 
         yield NewsTicker()
 
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        # Catch up on any refresh skipped while the newly shown tab was hidden
+        def catch_up() -> None:
+            for widget in (*self.query(FiscalDashboard), *self.query(GlobalGrid), *self.query(LiquidityPanel)):
+                widget.refresh_if_stale()
+        self.call_after_refresh(catch_up)
+
     def action_refresh_data(self):
         # Trigger reload on all dashboards
         for dashboard in self.query(FiscalDashboard):
@@ -444,8 +736,11 @@ class SentinelApp(App):
         for grid in self.query(GlobalGrid):
             grid.load_data()
         for liq in self.query(LiquidityPanel):
-            liq.load_chart()
+            liq.request_refresh()
 
 if __name__ == "__main__":
+    # Run directly: going through main.main() would import this file a second
+    # time as "tui" and build every module-level session and cache twice
+    data_loader.init_db()
     app = SentinelApp()
     app.run()